@@ -9,18 +9,23 @@ NOTE: This code does not use emojis. Emojis should never be used in this codebas
 
 import subprocess
 import json
-import platform
-import uuid
-import socket
 import sys
+import argparse
 import os
 import logging
 import threading
 import time
 import queue
+import atexit
+import functools
+import hashlib
+import re
+import select
+import codecs
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 def install_dependencies():
     """Auto-install required dependencies"""
@@ -45,24 +50,67 @@ def install_dependencies():
                     print(f"Could not install {package}. Some features may be limited.")
                     print("Continuing anyway...")
 
-# Install dependencies first
-print("Initializing Evaders HWID...")
-install_dependencies()
+# psutil is only needed for HWID collection, so it is imported on first use
+# rather than at startup (run with --install-deps to install it)
+_psutil = None
+_psutil_loaded = False
+_psutil_lock = threading.Lock()
 
-# Now import the installed packages
+def get_psutil():
+    """Import psutil on first use, returns None if it is not available"""
+    global _psutil, _psutil_loaded
+    with _psutil_lock:
+        if not _psutil_loaded:
+            _psutil_loaded = True
+            try:
+                import psutil
+                _psutil = psutil
+            except ImportError:
+                print("Warning: psutil not available. Some system information will be limited.")
+                print("Run with --install-deps to install it.")
+        return _psutil
+
+# Optional faster JSON backend, the standard library is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Windows registry access for auto-start (Windows only)
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+# Console keyboard polling for prompts (Windows only)
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# Single keypress reads on POSIX terminals
 try:
-    import psutil
+    import termios
+    import tty
 except ImportError:
-    print("Warning: psutil not available. Some system information will be limited.")
-    psutil = None
+    termios = None
+
+# The platform never changes while running, check it once
+IS_WINDOWS = os.name == 'nt'
+
+# Separator lines used by the console screens
+BAR60 = "=" * 60
+BAR50 = "=" * 50
+DASH30 = "-" * 30
 
-# Setup logging and data directory
+# Data directory shared by logs, settings, statistics and reports
+DATA_DIR = Path("data")
+
+# Setup logging
 def setup_logging():
-    """Setup logging configuration"""
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    
-    log_file = data_dir / "evaders_hwid.log"
+    """Setup logging configuration, creating the data directory on first run"""
+    DATA_DIR.mkdir(exist_ok=True)
+    log_file = DATA_DIR / "evaders_hwid.log"
     
     logging.basicConfig(
         level=logging.INFO,
@@ -74,14 +122,100 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+# Module-level logger shared by all managers and helpers
+logger = logging.getLogger(__name__)
+
+def json_dumps(data, default=None):
+    """Serialize data to indented JSON bytes, using orjson when available
+    
+    default converts objects JSON can't handle, as with json.dumps.
+    """
+    if orjson:
+        return orjson.dumps(data, default=default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=default).encode('utf-8')
+
+def json_loads(raw):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def read_json(path):
+    """Read and parse a JSON file"""
+    # Unbuffered, read() fetches the whole file in one call without an extra copy
+    with open(path, 'rb', buffering=0) as f:
+        return json_loads(f.read())
+
+def write_json_atomic(path, data):
+    """Write JSON to a temporary file and rename it over the target"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumps(data))
+        os.replace(tmp_path, path)
+    except Exception:
+        # Leave the previous file intact and don't leave a stray temp file behind
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+# Debounced saving shared by the settings and statistics managers
+class DebouncedSaveMixin:
+    flush_interval = 2.0  # Minimum seconds between writes
+    
+    def init_debounce(self, save_callback):
+        """Setup dirty tracking, save_callback writes the data to disk"""
+        self._save_callback = save_callback
+        self._dirty = False
+        self._last_flush = 0.0
+        self._flush_timer = None
+        self._flush_lock = threading.RLock()
+        atexit.register(self.flush)
+    
+    def mark_dirty(self):
+        """Record a pending change, writing now or once the flush interval elapses"""
+        with self._flush_lock:
+            self._dirty = True
+            elapsed = time.monotonic() - self._last_flush
+            if elapsed >= self.flush_interval:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval - elapsed, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def mark_saved(self):
+        """Record that all changes have been written to disk"""
+        with self._flush_lock:
+            self._dirty = False
+            self._last_flush = time.monotonic()
+    
+    def flush(self):
+        """Write pending changes to disk"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._save_callback()
+    
+    def force_save(self):
+        """Write to disk immediately, even without pending changes"""
+        with self._flush_lock:
+            self._dirty = True
+            self.flush()
+
 # Settings management
-class SettingsManager:
+class SettingsManager(DebouncedSaveMixin):
     def __init__(self):
-        self.data_dir = Path("data")
-        self.data_dir.mkdir(exist_ok=True)
+        self.data_dir = DATA_DIR
         self.settings_file = self.data_dir / "settings.json"
-        self.logger = logging.getLogger(__name__)
+        self.init_debounce(self.save_settings)
         self.settings = self.load_settings()
+        self.refresh_bans()
     
     def load_settings(self):
         """Load settings from JSON file"""
@@ -101,77 +235,110 @@ class SettingsManager:
         
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    # Merge with defaults for any missing keys
-                    for key, value in default_settings.items():
-                        if key not in settings:
-                            settings[key] = value
-                    self.logger.info("Settings loaded from file")
-                    return settings
+                settings = read_json(self.settings_file)
+                # Merge with defaults for any missing keys
+                for key, value in default_settings.items():
+                    if key not in settings:
+                        settings[key] = value
+                logger.info("Settings loaded from file")
+                return settings
             else:
-                self.logger.info("Creating default settings file")
+                logger.info("Creating default settings file")
                 self.save_settings(default_settings)
                 return default_settings
         except Exception as e:
-            self.logger.error(f"Error loading settings: {e}")
+            logger.error(f"Error loading settings: {e}")
             return default_settings
     
     def save_settings(self, settings=None):
         """Save settings to JSON file"""
-        if settings:
-            self.settings = settings
-        
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
-            self.logger.info("Settings saved to file")
-        except Exception as e:
-            self.logger.error(f"Error saving settings: {e}")
+        with self._flush_lock:
+            if settings:
+                self.settings = settings
+            
+            try:
+                write_json_atomic(self.settings_file, self.settings)
+                self.mark_saved()
+                logger.debug("Settings saved to file")
+            except Exception as e:
+                logger.error(f"Error saving settings: {e}")
     
     def get(self, key, default=None):
-        """Get setting value"""
+        """Get setting value, served from memory, the file is only read at startup"""
         return self.settings.get(key, default)
     
     def set(self, key, value):
-        """Set setting value"""
-        self.settings[key] = value
-        self.save_settings()
+        """Set setting value, the write to disk is debounced"""
+        with self._flush_lock:
+            self.settings[key] = value
+            if key == 'banned_hwids':
+                self.refresh_bans()
+            self.mark_dirty()
+    
+    def refresh_bans(self):
+        """Rebuild the banned hash set from the persisted ban list"""
+        self._banned_set = set(self.settings.get('banned_hwids', []))
+    
+    def is_hwid_banned(self, hwid_hash):
+        """Check whether a HWID hash is on the ban list"""
+        return hwid_hash in self._banned_set
+    
+    def add_banned_hwid(self, hwid_hash):
+        """Add a hash to the ban list, returns False if it was already banned"""
+        with self._flush_lock:
+            if hwid_hash in self._banned_set:
+                return False
+            self._banned_set.add(hwid_hash)
+            self.settings.setdefault('banned_hwids', []).append(hwid_hash)
+            self.mark_dirty()
+            return True
+    
+    def remove_banned_hwid(self, hwid_hash):
+        """Remove a hash from the ban list, returns False if it wasn't banned"""
+        with self._flush_lock:
+            if hwid_hash not in self._banned_set:
+                return False
+            self._banned_set.discard(hwid_hash)
+            self.settings['banned_hwids'].remove(hwid_hash)
+            self.mark_dirty()
+            return True
 
 # Windows Auto-Start Manager
 class WindowsStartupManager:
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
         self.app_name = "Evaders_HWID"
         self.script_path = os.path.abspath(__file__)
         
     def is_windows(self):
         """Check if running on Windows"""
-        return platform.system() == 'Windows'
+        return IS_WINDOWS
     
     def get_startup_registry_key(self):
-        """Get Windows startup registry key path"""
-        return r"HKEY_CURRENT_USER\Software\Microsoft\Windows\CurrentVersion\Run"
+        """Get Windows startup registry key path (relative to HKEY_CURRENT_USER)"""
+        return r"Software\Microsoft\Windows\CurrentVersion\Run"
+    
+    def open_startup_registry_key(self, access):
+        """Open the Windows startup registry key with the given access rights"""
+        return winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.get_startup_registry_key(), 0, access)
     
     def is_auto_start_enabled(self):
         """Check if auto-start is currently enabled"""
-        if not self.is_windows():
+        if not self.is_windows() or winreg is None:
             return False
             
         try:
-            result = subprocess.run([
-                'reg', 'query', self.get_startup_registry_key(), 
-                '/v', self.app_name
-            ], capture_output=True, text=True, shell=True)
-            
-            return result.returncode == 0
+            with self.open_startup_registry_key(winreg.KEY_READ) as key:
+                winreg.QueryValueEx(key, self.app_name)
+            return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
-            self.logger.error(f"Error checking auto-start status: {e}")
+            logger.error(f"Error checking auto-start status: {e}")
             return False
     
     def enable_auto_start(self):
         """Enable auto-start with Windows"""
-        if not self.is_windows():
+        if not self.is_windows() or winreg is None:
             return False, "Auto-start is only available on Windows"
             
         try:
@@ -179,59 +346,47 @@ class WindowsStartupManager:
             python_exe = sys.executable
             command = f'"{python_exe}" "{self.script_path}"'
             
-            result = subprocess.run([
-                'reg', 'add', self.get_startup_registry_key(),
-                '/v', self.app_name,
-                '/t', 'REG_SZ',
-                '/d', command,
-                '/f'
-            ], capture_output=True, text=True, shell=True)
+            with self.open_startup_registry_key(winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, command)
             
-            if result.returncode == 0:
-                self.logger.info("Auto-start enabled successfully")
-                return True, "Auto-start with Windows enabled"
-            else:
-                self.logger.error(f"Failed to enable auto-start: {result.stderr}")
-                return False, f"Failed to enable auto-start: {result.stderr}"
+            logger.info("Auto-start enabled successfully")
+            return True, "Auto-start with Windows enabled"
                 
         except Exception as e:
-            self.logger.error(f"Error enabling auto-start: {e}")
+            logger.error(f"Error enabling auto-start: {e}")
             return False, f"Error enabling auto-start: {e}"
     
     def disable_auto_start(self):
         """Disable auto-start with Windows"""
-        if not self.is_windows():
+        if not self.is_windows() or winreg is None:
             return False, "Auto-start is only available on Windows"
             
         try:
-            result = subprocess.run([
-                'reg', 'delete', self.get_startup_registry_key(),
-                '/v', self.app_name,
-                '/f'
-            ], capture_output=True, text=True, shell=True)
+            with self.open_startup_registry_key(winreg.KEY_SET_VALUE) as key:
+                winreg.DeleteValue(key, self.app_name)
             
-            if result.returncode == 0:
-                self.logger.info("Auto-start disabled successfully")
-                return True, "Auto-start with Windows disabled"
-            else:
-                # If the key doesn't exist, that's also success
-                if "cannot find" in result.stderr.lower():
-                    return True, "Auto-start was already disabled"
-                self.logger.error(f"Failed to disable auto-start: {result.stderr}")
-                return False, f"Failed to disable auto-start: {result.stderr}"
+            logger.info("Auto-start disabled successfully")
+            return True, "Auto-start with Windows disabled"
                 
+        except FileNotFoundError:
+            # If the value doesn't exist, that's also success
+            return True, "Auto-start was already disabled"
         except Exception as e:
-            self.logger.error(f"Error disabling auto-start: {e}")
+            logger.error(f"Error disabling auto-start: {e}")
             return False, f"Error disabling auto-start: {e}"
 
 # Statistics Manager for HWID Change Tracking
-class HWIDStatsManager:
+class HWIDStatsManager(DebouncedSaveMixin):
+    daily_retention = 90     # Days of daily check counts to keep
+    monthly_retention = 24   # Months of monthly stats to keep
+
     def __init__(self):
-        self.data_dir = Path("data")
-        self.data_dir.mkdir(exist_ok=True)
+        self.data_dir = DATA_DIR
         self.stats_file = self.data_dir / "hwid_stats.json"
-        self.logger = logging.getLogger(__name__)
+        self.init_debounce(self.save_stats)
         self.stats = self.load_stats()
+        self.build_hash_indexes()
+        self.backfill_epochs()
     
     def load_stats(self):
         """Load statistics from JSON file"""
@@ -241,6 +396,8 @@ class HWIDStatsManager:
             "first_check": None,
             "last_check": None,
             "last_change": None,
+            "first_check_epoch": None,  # Epoch seconds of first_check/last_check
+            "last_check_epoch": None,
             "change_history": [],  # List of change events with timestamps
             "monthly_stats": {},   # Monthly aggregated data
             "daily_checks": {},    # Daily check counts
@@ -249,98 +406,168 @@ class HWIDStatsManager:
         
         try:
             if self.stats_file.exists():
-                with open(self.stats_file, 'r') as f:
-                    stats = json.load(f)
-                    # Merge with defaults for any missing keys
-                    for key, value in default_stats.items():
-                        if key not in stats:
-                            stats[key] = value
-                    self.logger.info("HWID statistics loaded from file")
-                    return stats
+                stats = read_json(self.stats_file)
+                # Merge with defaults for any missing keys
+                for key, value in default_stats.items():
+                    if key not in stats:
+                        stats[key] = value
+                logger.info("HWID statistics loaded from file")
+                return stats
             else:
-                self.logger.info("Creating default statistics file")
+                logger.info("Creating default statistics file")
                 self.save_stats(default_stats)
                 return default_stats
         except Exception as e:
-            self.logger.error(f"Error loading statistics: {e}")
+            logger.error(f"Error loading statistics: {e}")
             return default_stats
     
     def save_stats(self, stats=None):
         """Save statistics to JSON file"""
-        if stats:
-            self.stats = stats
-        
-        try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
-            self.logger.info("HWID statistics saved to file")
-        except Exception as e:
-            self.logger.error(f"Error saving statistics: {e}")
+        with self._flush_lock:
+            if stats:
+                self.stats = stats
+            
+            try:
+                write_json_atomic(self.stats_file, self.stats)
+                self.mark_saved()
+                logger.debug("HWID statistics saved to file")
+            except Exception as e:
+                logger.error(f"Error saving statistics: {e}")
+    
+    def build_hash_indexes(self):
+        """Build in-memory sets mirroring the persisted HWID hash lists"""
+        self._hash_set = set(self.stats['hwid_hashes'])
+        self._monthly_hash_sets = {}
+        for month, month_data in self.stats['monthly_stats'].items():
+            # Older stats files may hold a set converted mid-check, normalise to a list
+            month_data['unique_hwids'] = list(month_data.get('unique_hwids', []))
+            self._monthly_hash_sets[month] = set(month_data['unique_hwids'])
+    
+    def replace_hash(self, old_hash, new_hash):
+        """Swap a recorded HWID hash for its rehashed form, e.g. after a hash algorithm change"""
+        with self._flush_lock:
+            def swap(hashes):
+                # Keep the original order and drop a duplicate if both were recorded
+                replaced = []
+                for h in hashes:
+                    h = new_hash if h == old_hash else h
+                    if h not in replaced:
+                        replaced.append(h)
+                return replaced
+            
+            self.stats['hwid_hashes'] = swap(self.stats['hwid_hashes'])
+            for month_data in self.stats['monthly_stats'].values():
+                month_data['unique_hwids'] = swap(month_data['unique_hwids'])
+            self.build_hash_indexes()
+            self.mark_dirty()
+    
+    def backfill_epochs(self):
+        """Add epoch timestamps to stats written before they were recorded"""
+        for key in ('first_check', 'last_check'):
+            if self.stats[key] and self.stats[f'{key}_epoch'] is None:
+                self.stats[f'{key}_epoch'] = datetime.fromisoformat(self.stats[key]).timestamp()
+        
+        for change in self.stats['change_history']:
+            if 'epoch' not in change:
+                change['epoch'] = datetime.fromisoformat(change['timestamp']).timestamp()
+    
+    def trim_history(self, history, retention, current_key):
+        """Drop the oldest date-keyed entries beyond retention, returns removed keys
+        
+        current_key is never removed, even if the clock went back and it is
+        older than every other entry.
+        """
+        if len(history) <= retention:
+            return []
+        # Date keys are ISO formatted, so they sort chronologically
+        older = sorted(key for key in history if key != current_key)
+        expired = older[:len(history) - retention]
+        for key in expired:
+            del history[key]
+        return expired
     
     def record_check(self, hwid_hash, changed=False):
         """Record an HWID check and whether it changed"""
-        now = datetime.now()
-        timestamp = now.isoformat()
-        date_key = now.strftime('%Y-%m-%d')
-        month_key = now.strftime('%Y-%m')
-        
-        # Update basic counters
-        self.stats['total_checks'] += 1
-        self.stats['last_check'] = timestamp
-        
-        if self.stats['first_check'] is None:
-            self.stats['first_check'] = timestamp
-        
-        # Update daily check count
-        if date_key not in self.stats['daily_checks']:
-            self.stats['daily_checks'][date_key] = 0
-        self.stats['daily_checks'][date_key] += 1
-        
-        # Initialize monthly stats if needed
-        if month_key not in self.stats['monthly_stats']:
-            self.stats['monthly_stats'][month_key] = {
-                'checks': 0,
-                'changes': 0,
-                'unique_hwids': set()
-            }
-        
-        self.stats['monthly_stats'][month_key]['checks'] += 1
-        self.stats['monthly_stats'][month_key]['unique_hwids'].add(hwid_hash)
-        
-        # Record HWID hash
-        if hwid_hash not in self.stats['hwid_hashes']:
-            self.stats['hwid_hashes'].append(hwid_hash)
-        
-        # Handle changes
-        if changed:
-            self.stats['total_changes'] += 1
-            self.stats['last_change'] = timestamp
-            self.stats['monthly_stats'][month_key]['changes'] += 1
+        with self._flush_lock:
+            now = datetime.now()
+            timestamp = now.isoformat()
+            epoch = now.timestamp()
+            date_key = now.strftime('%Y-%m-%d')
+            month_key = now.strftime('%Y-%m')
             
-            # Record change event
-            change_event = {
-                'timestamp': timestamp,
-                'new_hwid_hash': hwid_hash,
-                'check_number': self.stats['total_checks']
-            }
-            self.stats['change_history'].append(change_event)
+            # Update basic counters
+            self.stats['total_checks'] += 1
+            self.stats['last_check'] = timestamp
+            self.stats['last_check_epoch'] = epoch
             
-            self.logger.warning(f"HWID change detected! Total changes: {self.stats['total_changes']}")
-        
-        # Convert sets to lists for JSON serialization
-        for month_data in self.stats['monthly_stats'].values():
-            if isinstance(month_data['unique_hwids'], set):
-                month_data['unique_hwids'] = list(month_data['unique_hwids'])
-        
-        self.save_stats()
+            if self.stats['first_check'] is None:
+                self.stats['first_check'] = timestamp
+                self.stats['first_check_epoch'] = epoch
+            
+            # Update daily check count
+            if date_key not in self.stats['daily_checks']:
+                self.stats['daily_checks'][date_key] = 0
+                self.trim_history(self.stats['daily_checks'], self.daily_retention, date_key)
+            self.stats['daily_checks'][date_key] += 1
+            
+            # Initialize monthly stats if needed
+            if month_key not in self.stats['monthly_stats']:
+                self.stats['monthly_stats'][month_key] = {
+                    'checks': 0,
+                    'changes': 0,
+                    'unique_hwids': []
+                }
+                self._monthly_hash_sets[month_key] = set()
+                for month in self.trim_history(self.stats['monthly_stats'], self.monthly_retention, month_key):
+                    del self._monthly_hash_sets[month]
+            
+            self.stats['monthly_stats'][month_key]['checks'] += 1
+            month_hashes = self._monthly_hash_sets[month_key]
+            if hwid_hash not in month_hashes:
+                month_hashes.add(hwid_hash)
+                self.stats['monthly_stats'][month_key]['unique_hwids'].append(hwid_hash)
+            
+            # Record HWID hash
+            if hwid_hash not in self._hash_set:
+                self._hash_set.add(hwid_hash)
+                self.stats['hwid_hashes'].append(hwid_hash)
+            
+            # Handle changes
+            if changed:
+                self.stats['total_changes'] += 1
+                self.stats['last_change'] = timestamp
+                self.stats['monthly_stats'][month_key]['changes'] += 1
+                
+                # Record change event
+                change_event = {
+                    'timestamp': timestamp,
+                    'epoch': epoch,
+                    'new_hwid_hash': hwid_hash,
+                    'check_number': self.stats['total_checks']
+                }
+                self.stats['change_history'].append(change_event)
+                
+                logger.warning(f"HWID change detected! Total changes: {self.stats['total_changes']}")
+            
+            self.mark_dirty()
+    
+    @property
+    def total_checks(self):
+        """Number of HWID checks recorded"""
+        return self.stats['total_checks']
+    
+    @property
+    def total_changes(self):
+        """Number of HWID changes recorded"""
+        return self.stats['total_changes']
     
     def get_change_frequency(self):
         """Calculate average changes per month"""
         if not self.stats['first_check'] or self.stats['total_changes'] == 0:
             return 0
         
-        first_check = datetime.fromisoformat(self.stats['first_check'])
-        last_check = datetime.fromisoformat(self.stats['last_check'])
+        first_check = datetime.fromtimestamp(self.stats['first_check_epoch'])
+        last_check = datetime.fromtimestamp(self.stats['last_check_epoch'])
         
         # Calculate months between first and last check
         months_diff = (last_check.year - first_check.year) * 12 + (last_check.month - first_check.month)
@@ -378,12 +605,12 @@ class HWIDStatsManager:
         print(f"  Total HWID Changes: {self.stats['total_changes']}")
         print(f"  Unique HWIDs Seen: {len(self.stats['hwid_hashes'])}")
         
-        if self.stats['first_check']:
-            first_check = datetime.fromisoformat(self.stats['first_check'])
+        if self.stats['first_check_epoch'] is not None:
+            first_check = datetime.fromtimestamp(self.stats['first_check_epoch'])
             print(f"  First Check: {first_check.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        if self.stats['last_check']:
-            last_check = datetime.fromisoformat(self.stats['last_check'])
+        if self.stats['last_check_epoch'] is not None:
+            last_check = datetime.fromtimestamp(self.stats['last_check_epoch'])
             print(f"  Last Check: {last_check.strftime('%Y-%m-%d %H:%M:%S')}")
         
         if self.stats['last_change']:
@@ -403,32 +630,103 @@ class HWIDStatsManager:
         monthly_summary = self.get_monthly_summary()
         if monthly_summary:
             print(f"\nMONTHLY BREAKDOWN:")
-            for month in sorted(monthly_summary.keys(), reverse=True)[:6]:  # Last 6 months
+            # Months are added in chronological order, newest last
+            for month in list(monthly_summary)[-6:][::-1]:  # Last 6 months
                 data = monthly_summary[month]
                 print(f"  {month}: {data['checks']} checks, {data['changes']} changes ({data['change_rate']}%), {data['unique_hwids']} unique HWIDs")
         
         # Recent changes
         if self.stats['change_history']:
             print(f"\nRECENT CHANGES (Last 5):")
-            recent_changes = sorted(self.stats['change_history'], 
-                                  key=lambda x: x['timestamp'], reverse=True)[:5]
+            # change_history is append-only, so the newest events are at the end
+            recent_changes = self.stats['change_history'][-5:][::-1]
             for change in recent_changes:
-                timestamp = datetime.fromisoformat(change['timestamp'])
+                timestamp = datetime.fromtimestamp(change['epoch'])
                 print(f"  {timestamp.strftime('%Y-%m-%d %H:%M:%S')} - Check #{change['check_number']}")
         
         print("="*70)
 
+# WMI queries issued for a full HWID collection, keyed by result name.
+# All of them are sent to PowerShell in a single batched invocation.
+WMI_QUERIES = {
+    # Core HWID
+    'diskdrive': ("Win32_DiskDrive", "Model,SerialNumber"),
+    'cpu_serial': ("Win32_Processor", "SerialNumber"),
+    'bios_serial': ("Win32_BIOS", "SerialNumber"),
+    'motherboard_serial': ("Win32_BaseBoard", "SerialNumber"),
+    'smbios_uuid': ("Win32_ComputerSystemProduct", "UUID"),
+    # Detailed hardware information
+    'operating_system': ("Win32_OperatingSystem", "Caption,Version,BuildNumber,SerialNumber,InstallDate,RegisteredUser"),
+    'cpu_details': ("Win32_Processor", "Name,ProcessorId,Manufacturer,MaxClockSpeed,Family,Model,Stepping,Description"),
+    'memory_modules': ("Win32_PhysicalMemory", "Capacity,Speed,Manufacturer,PartNumber,SerialNumber,DeviceLocator,BankLabel,MemoryType,TypeDetail"),
+    'physical_drives': ("Win32_DiskDrive", "Model,SerialNumber,Size,MediaType,InterfaceType,Partitions,Manufacturer"),
+    'network_adapters': ("Win32_NetworkAdapter", "Name,MACAddress,PNPDeviceID,Manufacturer,ProductName"),
+    'motherboard': ("Win32_BaseBoard", "Manufacturer,Product,SerialNumber,Version,Model,PartNumber,Tag"),
+    'bios': ("Win32_BIOS", "Manufacturer,SMBIOSBIOSVersion,SerialNumber,Version,ReleaseDate,BIOSVersion,Name"),
+    'system_product': ("Win32_ComputerSystemProduct", "Name,Vendor,Version,SerialNumber,UUID,IdentifyingNumber"),
+    'video_controllers': ("Win32_VideoController", "Name,PNPDeviceID,AdapterRAM,DriverVersion,DriverDate,VideoProcessor"),
+    'usb_hubs': ("Win32_USBHub", "Name,DeviceID,Description"),
+    'sound_devices': ("Win32_SoundDevice", "Name,DeviceID,Manufacturer"),
+    'system_slots': ("Win32_SystemSlot", "SlotDesignation,CurrentUsage,SlotType,MaxDataWidth"),
+    'tpm_details': ("Win32_Tpm", "SpecVersion,ManufacturerVersion,ManufacturerVersionInfo"),
+}
+
+# Active network adapters (getmac equivalent), not a plain Get-CimInstance query
+MAC_ADDRESS_COMMAND = 'Get-NetAdapter | Where-Object {$_.Status -eq "Up"} | Select-Object Name, MacAddress | Format-List'
+
+def build_wmi_command(wmi_class, properties, source=None):
+    """Build the PowerShell pipeline for a WMI query
+    
+    source replaces the Get-CimInstance call, e.g. to read from the batch cache.
+    """
+    if source is None:
+        source = f"Get-CimInstance -ClassName {wmi_class}"
+    return f"{source} | Select-Object {properties} | Format-List"
+
+# Inside a batch every class is fetched once and shared by all queries on it,
+# e.g. the core Win32_DiskDrive serials and the full physical drive details
+BATCH_CIM_FUNCTION = (
+    '$cim = @{}; function Get-HwidCim($c) { '
+    'if (-not $cim.ContainsKey($c)) { $cim[$c] = @(Get-CimInstance -ClassName $c) }; $cim[$c] }'
+)
+
+# Commands for the known queries are built once at import
+WMI_COMMANDS = {key: build_wmi_command(wmi_class, properties)
+                for key, (wmi_class, properties) in WMI_QUERIES.items()}
+WMI_BATCH_COMMANDS = {key: build_wmi_command(wmi_class, properties, f"Get-HwidCim {wmi_class}")
+                      for key, (wmi_class, properties) in WMI_QUERIES.items()}
+
+# Keep PowerShell child processes from flashing a console window on Windows
+if IS_WINDOWS:
+    SUBPROCESS_FLAGS = {'creationflags': subprocess.CREATE_NO_WINDOW}
+else:
+    SUBPROCESS_FLAGS = {}
+
+# Shared thread pool for blocking PowerShell calls, created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Get the shared thread pool used to run PowerShell calls concurrently"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hwid-query')
+        return _executor
+
 def run_wmi_query(wmi_class, properties):
     """Execute WMI query using PowerShell Get-CimInstance and return results"""
+    # Build PowerShell command using Get-CimInstance (modern replacement for wmic)
+    return run_powershell_command(build_wmi_command(wmi_class, properties))
+
+def run_powershell_command(ps_command):
+    """Execute a single PowerShell command and return its output"""
     try:
-        # Build PowerShell command using Get-CimInstance (modern replacement for wmic)
-        ps_command = f"Get-CimInstance -ClassName {wmi_class} | Select-Object {properties} | Format-List"
-        
         result = subprocess.run(
-            ['powershell', '-Command', ps_command],
+            ['powershell', '-NoProfile', '-NonInteractive', '-Command', ps_command],
             capture_output=True,
             text=True,
-            shell=False
+            **SUBPROCESS_FLAGS
         )
         
         if result.returncode == 0:
@@ -438,92 +736,257 @@ def run_wmi_query(wmi_class, properties):
     except Exception as e:
         return f"Error: {str(e)}"
 
-def parse_wmi_output(wmi_text):
-    """Parse PowerShell Format-List output into clean key-value pairs, handling multiple objects"""
+def build_batch_script(commands):
+    """Build a single PowerShell script that runs every command and emits JSON
+    
+    Each command's Format-List output is captured as text, so results are
+    identical to what run_wmi_query returns for the same query.
+    """
+    statements = ['$ErrorActionPreference = "Stop"', BATCH_CIM_FUNCTION, '$r = [ordered]@{}']
+    for key, command in commands.items():
+        statements.append(
+            f"try {{ $r['{key}'] = ({command} | Out-String) }} "
+            f"catch {{ $r['{key}'] = 'Error: ' + $_.Exception.Message }}"
+        )
+    statements.append('$r | ConvertTo-Json -Compress')
+    return '; '.join(statements)
+
+# Persistent PowerShell process, so repeated collections skip PowerShell startup
+class PowerShellSession:
+    end_marker = '---EVADERS-HWID-END---'
+    
+    def __init__(self):
+        self.process = None
+        self.lock = threading.Lock()
+    
+    def _start(self):
+        """Start PowerShell reading commands from stdin"""
+        self.process = subprocess.Popen(
+            ['powershell', '-NoProfile', '-NoLogo', '-NonInteractive', '-Command', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            **SUBPROCESS_FLAGS
+        )
+    
+    def _stop(self):
+        """Terminate the PowerShell process"""
+        if self.process is not None:
+            try:
+                self.process.kill()
+                self.process.wait(timeout=2)
+            except Exception:
+                pass
+            self.process = None
+    
+    def query(self, script):
+        """Run a single-line script in the session and return its output"""
+        with self.lock:
+            if self.process is None or self.process.poll() is not None:
+                self._start()
+            
+            try:
+                self.process.stdin.write(f"{script}\nWrite-Output '{self.end_marker}'\n")
+                self.process.stdin.flush()
+                
+                lines = []
+                while True:
+                    line = self.process.stdout.readline()
+                    if not line:
+                        raise RuntimeError("PowerShell session exited unexpectedly")
+                    if line.strip() == self.end_marker:
+                        return ''.join(lines)
+                    lines.append(line)
+            except Exception:
+                # The session is in an unknown state, start a fresh one next time
+                self._stop()
+                raise
+    
+    def close(self):
+        """Shut down the PowerShell process"""
+        with self.lock:
+            self._stop()
+
+_powershell_session = None
+_powershell_session_lock = threading.Lock()
+_powershell_missing = None  # Error text once PowerShell is known not to be installed
+
+def get_powershell_session():
+    """Get the shared PowerShell session, created on first use"""
+    global _powershell_session
+    with _powershell_session_lock:
+        if _powershell_session is None:
+            _powershell_session = PowerShellSession()
+            atexit.register(_powershell_session.close)
+        return _powershell_session
+
+def run_powershell_batch(commands, fallback_commands=None):
+    """Run several PowerShell commands in one invocation, returns {key: output text}
+    
+    fallback_commands are standalone versions of commands, run separately if
+    the batch fails.
+    """
+    global _powershell_missing
+    if _powershell_missing is not None:
+        return {key: _powershell_missing for key in commands}
+    
+    script = build_batch_script(commands)
+    
+    try:
+        stdout = get_powershell_session().query(script)
+    except FileNotFoundError as e:
+        # Not installed (e.g. not on Windows), retrying would fail the same way
+        logger.debug(f"PowerShell not found, skipping WMI queries: {e}")
+        _powershell_missing = f"Error: {e}"
+        return {key: _powershell_missing for key in commands}
+    except Exception as e:
+        logger.warning(f"PowerShell session unavailable, starting a new process: {e}")
+        stdout = None
+    
+    try:
+        if stdout is None:
+            result = subprocess.run(
+                ['powershell', '-NoProfile', '-NonInteractive', '-Command', script],
+                capture_output=True,
+                text=True,
+                **SUBPROCESS_FLAGS
+            )
+            
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip())
+            stdout = result.stdout
+        
+        output = json_loads(stdout) if stdout.strip() else {}
+    except Exception as e:
+        logger.warning(f"Batched PowerShell query failed, running queries separately: {e}")
+        return run_powershell_parallel(fallback_commands or commands)
+    
+    results = {}
+    for key in commands:
+        value = output.get(key)
+        if value is None:
+            results[key] = ""
+        else:
+            # Out-String uses CRLF line endings, normalise to match run_wmi_query
+            results[key] = str(value).replace('\r\n', '\n').strip()
+    return results
+
+def run_powershell_parallel(commands):
+    """Run PowerShell commands as separate processes on the shared thread pool"""
+    keys = list(commands)
+    outputs = get_executor().map(run_powershell_command, [commands[key] for key in keys])
+    return dict(zip(keys, outputs))
+
+def run_wmi_batch(queries, extra_commands=None):
+    """Execute several WMI queries in a single PowerShell invocation
+    
+    queries maps a result key to a (wmi_class, properties) tuple, extra_commands
+    maps a result key to any other PowerShell pipeline to run in the same batch.
+    """
+    commands = {}
+    fallback_commands = {}
+    for key, (wmi_class, properties) in queries.items():
+        if WMI_QUERIES.get(key) == (wmi_class, properties):
+            commands[key] = WMI_BATCH_COMMANDS[key]
+            fallback_commands[key] = WMI_COMMANDS[key]
+        else:
+            commands[key] = build_wmi_command(wmi_class, properties, f"Get-HwidCim {wmi_class}")
+            fallback_commands[key] = build_wmi_command(wmi_class, properties)
+    if extra_commands:
+        commands.update(extra_commands)
+        fallback_commands.update(extra_commands)
+    return run_powershell_batch(commands, fallback_commands)
+
+def wmi_result(wmi_results, key):
+    """Get a query result from a batch, running the query on its own if missing"""
+    if wmi_results is not None and key in wmi_results:
+        return wmi_results[key]
+    return run_powershell_command(WMI_COMMANDS[key])
+
+def parse_wmi_output(wmi_text, copy=True):
+    """Parse PowerShell Format-List output into clean key-value pairs, handling multiple objects
+    
+    Parsing is memoized per raw text. Callers that only read the result can pass
+    copy=False to get the cached objects themselves, which must not be modified.
+    """
     if not wmi_text or "Error:" in wmi_text:
         return {}
     
-    results = []
-    current_object = {}
-    lines = wmi_text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Empty line indicates end of an object
-        if not line:
-            if current_object:
-                results.append(current_object)
-                current_object = {}
-            continue
-            
-        # PowerShell Format-List uses ' : ' as separator
-        if ' : ' in line:
-            key, value = line.split(' : ', 1)
-            key = key.strip()
-            value = value.strip()
-            if value and value != "" and value != "{}":
-                current_object[key] = value
-        # Also handle '=' format for compatibility
-        elif '=' in line and not line.startswith('='):
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-            if value and value != "":
-                current_object[key] = value
-    
-    # Add the last object if it exists
-    if current_object:
-        results.append(current_object)
+    results = _parse_wmi_objects(wmi_text)
     
     # If only one object, return it directly for backward compatibility
     # If multiple objects, return the list
     if len(results) == 1:
-        return results[0]
+        return dict(results[0]) if copy else results[0]
     elif len(results) > 1:
-        return results
+        return [dict(obj) for obj in results] if copy else list(results)
     else:
         return {}
 
-def get_core_hwid_info():
+# Format-List output: objects are separated by blank lines, properties use
+# ' : ' as separator, with '=' also accepted for compatibility
+_WMI_OBJECT_SEPARATOR = re.compile(r'\n\s*\n')
+_WMI_PROPERTY = re.compile(r'^[ \t]*(?:(\S.*?) : (.*\S)|([^=\s][^=\n]*)=(.*))[ \t]*$', re.MULTILINE)
+
+@functools.lru_cache(maxsize=64)
+def _parse_wmi_objects(wmi_text):
+    """Parse PowerShell Format-List output into a tuple of objects"""
+    results = []
+    
+    for chunk in _WMI_OBJECT_SEPARATOR.split(wmi_text):
+        current_object = {}
+        for match in _WMI_PROPERTY.finditer(chunk):
+            if match.group(1) is not None:
+                key, value = match.group(1).strip(), match.group(2).strip()
+                if value != "{}":
+                    current_object[key] = value
+            else:
+                key, value = match.group(3).strip(), match.group(4).strip()
+                if value:
+                    current_object[key] = value
+        if current_object:
+            results.append(current_object)
+    
+    return tuple(results)
+
+def get_core_hwid_info(wmi_results=None):
     """Get core HWID information"""
     print("Gathering core HWID information...")
     hwid_info = {}
     
     # 1. Disk Drive (model, serialnumber)
-    hwid_info['diskdrive'] = run_wmi_query("Win32_DiskDrive", "Model,SerialNumber")
+    hwid_info['diskdrive'] = wmi_result(wmi_results, 'diskdrive')
     
     # 2. CPU (serialnumber)
-    hwid_info['cpu_serial'] = run_wmi_query("Win32_Processor", "SerialNumber")
+    hwid_info['cpu_serial'] = wmi_result(wmi_results, 'cpu_serial')
     
     # 3. BIOS (serialnumber)
-    hwid_info['bios_serial'] = run_wmi_query("Win32_BIOS", "SerialNumber")
+    hwid_info['bios_serial'] = wmi_result(wmi_results, 'bios_serial')
     
     # 4. Motherboard (serialnumber)
-    hwid_info['motherboard_serial'] = run_wmi_query("Win32_BaseBoard", "SerialNumber")
+    hwid_info['motherboard_serial'] = wmi_result(wmi_results, 'motherboard_serial')
     
     # 5. smBIOS UUID
-    hwid_info['smbios_uuid'] = run_wmi_query("Win32_ComputerSystemProduct", "UUID")
+    hwid_info['smbios_uuid'] = wmi_result(wmi_results, 'smbios_uuid')
     
     # 6. MAC Addresses (getmac equivalent)
-    try:
-        result = subprocess.run(
-            ['powershell', '-Command', 'Get-NetAdapter | Where-Object {$_.Status -eq "Up"} | Select-Object Name, MacAddress | Format-List'],
-            capture_output=True,
-            text=True,
-            shell=False
-        )
-        hwid_info['mac_addresses'] = result.stdout.strip() if result.returncode == 0 else "Error getting MAC addresses"
-    except Exception as e:
-        hwid_info['mac_addresses'] = f"Error: {str(e)}"
+    if wmi_results is not None and 'mac_addresses' in wmi_results:
+        hwid_info['mac_addresses'] = wmi_results['mac_addresses']
+    else:
+        hwid_info['mac_addresses'] = run_powershell_command(MAC_ADDRESS_COMMAND)
     
     return hwid_info
 
-def get_system_info():
+def get_system_info(wmi_results=None):
     """Get comprehensive system information"""
     print("Gathering system information...")
     system_info = {}
     
+    import platform
+    import socket
+    import uuid
+    
     # Basic system info
     system_info['hostname'] = socket.gethostname()
     system_info['platform'] = platform.platform()
@@ -534,37 +997,60 @@ def get_system_info():
     system_info['node'] = platform.node()
     
     # Windows version details
-    wmi_os = run_wmi_query("Win32_OperatingSystem", "Caption,Version,BuildNumber,SerialNumber,InstallDate,RegisteredUser")
+    wmi_os = wmi_result(wmi_results, 'operating_system')
     system_info['operating_system'] = wmi_os
     
     return system_info
 
-def get_cpu_info():
+@functools.lru_cache(maxsize=1)
+def get_cpu_counts():
+    """Get (physical cores, logical threads), constant for the process lifetime"""
+    psutil = get_psutil()
+    return psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)
+
+# Disk partitions rarely change, reuse them across collections in quick succession
+PARTITION_CACHE_TTL = 5.0  # seconds
+_partition_cache = (0.0, None)
+
+def get_disk_partitions():
+    """Get psutil disk partitions, cached for PARTITION_CACHE_TTL seconds"""
+    global _partition_cache
+    now = time.monotonic()
+    cached_at, partitions = _partition_cache
+    if partitions is None or now - cached_at > PARTITION_CACHE_TTL:
+        partitions = get_psutil().disk_partitions()
+        _partition_cache = (now, partitions)
+    return partitions
+
+def get_cpu_info(wmi_results=None):
     """Get comprehensive CPU information and serial numbers"""
     print("Gathering CPU information...")
     cpu_info = {}
     
+    import platform
+    psutil = get_psutil()
+    
     # Basic CPU info
     cpu_info['name'] = platform.processor()
     cpu_info['architecture'] = platform.machine()
     
     if psutil:
-        cpu_info['cores'] = psutil.cpu_count(logical=False)
-        cpu_info['threads'] = psutil.cpu_count(logical=True)
+        cpu_info['cores'], cpu_info['threads'] = get_cpu_counts()
     else:
         cpu_info['cores'] = "N/A (psutil not available)"
         cpu_info['threads'] = "N/A (psutil not available)"
     
     # Comprehensive CPU details via WMI
-    wmi_cpu = run_wmi_query("Win32_Processor", "Name,ProcessorId,Manufacturer,MaxClockSpeed,Family,Model,Stepping,Description")
+    wmi_cpu = wmi_result(wmi_results, 'cpu_details')
     cpu_info['wmi_details'] = wmi_cpu
     
     return cpu_info
 
-def get_memory_info():
+def get_memory_info(wmi_results=None):
     """Get comprehensive RAM information and serial numbers"""
     print("Gathering RAM information...")
     memory_info = {}
+    psutil = get_psutil()
     
     # Basic memory info
     if psutil:
@@ -574,19 +1060,20 @@ def get_memory_info():
         memory_info['total_gb'] = "N/A (psutil not available)"
     
     # Comprehensive RAM info via WMI
-    wmi_ram = run_wmi_query("Win32_PhysicalMemory", "Capacity,Speed,Manufacturer,PartNumber,SerialNumber,DeviceLocator,BankLabel,MemoryType,TypeDetail")
+    wmi_ram = wmi_result(wmi_results, 'memory_modules')
     memory_info['modules'] = wmi_ram
     
     return memory_info
 
-def get_storage_info():
+def get_storage_info(wmi_results=None):
     """Get comprehensive storage device information and serial numbers"""
     print("Gathering storage information...")
     storage_info = {}
+    psutil = get_psutil()
     
     # Disk usage
     if psutil:
-        partitions = psutil.disk_partitions()
+        partitions = get_disk_partitions()
         storage_info['partitions'] = []
         
         for partition in partitions:
@@ -604,16 +1091,19 @@ def get_storage_info():
                 continue
     
     # Comprehensive physical drives via WMI
-    wmi_drives = run_wmi_query("Win32_DiskDrive", "Model,SerialNumber,Size,MediaType,InterfaceType,Partitions,Manufacturer")
+    wmi_drives = wmi_result(wmi_results, 'physical_drives')
     storage_info['physical_drives'] = wmi_drives
     
     return storage_info
 
-def get_network_info():
+def get_network_info(wmi_results=None):
     """Get comprehensive network adapter information and MAC addresses"""
     print("Gathering network information...")
     network_info = {}
     
+    import socket
+    psutil = get_psutil()
+    
     # Network interfaces
     if psutil:
         interfaces = psutil.net_if_addrs()
@@ -638,81 +1128,81 @@ def get_network_info():
         network_info['interfaces'] = "N/A (psutil not available)"
     
     # Comprehensive network adapters via WMI
-    wmi_network = run_wmi_query("Win32_NetworkAdapter", "Name,MACAddress,PNPDeviceID,Manufacturer,ProductName")
+    wmi_network = wmi_result(wmi_results, 'network_adapters')
     network_info['wmi_adapters'] = wmi_network
     
     return network_info
 
-def get_motherboard_bios_info():
+def get_motherboard_bios_info(wmi_results=None):
     """Get comprehensive motherboard and BIOS information with all serial numbers"""
     print("Gathering comprehensive motherboard and BIOS information...")
     mb_bios_info = {}
     
     # Comprehensive motherboard info via WMI
-    wmi_mb = run_wmi_query("Win32_BaseBoard", "Manufacturer,Product,SerialNumber,Version,Model,PartNumber,Tag")
+    wmi_mb = wmi_result(wmi_results, 'motherboard')
     mb_bios_info['motherboard'] = wmi_mb
     
     # Comprehensive BIOS info
-    wmi_bios = run_wmi_query("Win32_BIOS", "Manufacturer,SMBIOSBIOSVersion,SerialNumber,Version,ReleaseDate,BIOSVersion,Name")
+    wmi_bios = wmi_result(wmi_results, 'bios')
     mb_bios_info['bios'] = wmi_bios
     
     # Computer system product info (includes system serial)
-    wmi_product = run_wmi_query("Win32_ComputerSystemProduct", "Name,Vendor,Version,SerialNumber,UUID,IdentifyingNumber")
+    wmi_product = wmi_result(wmi_results, 'system_product')
     mb_bios_info['system_product'] = wmi_product
     
     return mb_bios_info
 
-def get_gpu_info():
+def get_gpu_info(wmi_results=None):
     """Get comprehensive GPU information"""
     print("Gathering GPU information...")
     gpu_info = {}
     
     # Comprehensive GPU via WMI
-    wmi_gpu = run_wmi_query("Win32_VideoController", "Name,PNPDeviceID,AdapterRAM,DriverVersion,DriverDate,VideoProcessor")
+    wmi_gpu = wmi_result(wmi_results, 'video_controllers')
     gpu_info['video_controllers'] = wmi_gpu
     
     return gpu_info
 
-def get_usb_devices():
+def get_usb_devices(wmi_results=None):
     """Get USB device information and serial numbers"""
     print("Gathering USB device information...")
     usb_info = {}
     
     # USB devices
-    wmi_usb = run_wmi_query("Win32_USBHub", "Name,DeviceID,Description")
+    wmi_usb = wmi_result(wmi_results, 'usb_hubs')
     usb_info['usb_hubs'] = wmi_usb
     
     return usb_info
 
-def get_audio_devices():
+def get_audio_devices(wmi_results=None):
     """Get audio device information"""
     print("Gathering audio device information...")
     audio_info = {}
     
     # Sound devices
-    wmi_sound = run_wmi_query("Win32_SoundDevice", "Name,DeviceID,Manufacturer")
+    wmi_sound = wmi_result(wmi_results, 'sound_devices')
     audio_info['sound_devices'] = wmi_sound
     
     return audio_info
 
-def get_system_slots():
+def get_system_slots(wmi_results=None):
     """Get system slot information"""
     print("Gathering system slot information...")
     slot_info = {}
     
     # System slots (PCI, PCIe, etc.)
-    wmi_slots = run_wmi_query("Win32_SystemSlot", "SlotDesignation,CurrentUsage,SlotType,MaxDataWidth")
+    wmi_slots = wmi_result(wmi_results, 'system_slots')
     slot_info['system_slots'] = wmi_slots
     
     return slot_info
 
-def get_tpm_info():
+def get_tpm_info(wmi_results=None):
     """Get TPM (Trusted Platform Module) information"""
     print("Gathering TPM information...")
     tpm_info = {}
     
     # TPM information
-    wmi_tpm = run_wmi_query("Win32_Tpm", "SpecVersion,ManufacturerVersion,ManufacturerVersionInfo")
+    wmi_tpm = wmi_result(wmi_results, 'tpm_details')
     tpm_info['tpm_details'] = wmi_tpm
     
     return tpm_info
@@ -726,7 +1216,7 @@ def display_core_hwid(hwid_data):
     # Disk Drive
     print("\nDISK DRIVE:")
     if 'diskdrive' in hwid_data:
-        disk_data = parse_wmi_output(hwid_data['diskdrive'])
+        disk_data = parse_wmi_output(hwid_data['diskdrive'], copy=False)
         if isinstance(disk_data, list):
             for i, disk in enumerate(disk_data, 1):
                 if 'Model' in disk:
@@ -742,7 +1232,7 @@ def display_core_hwid(hwid_data):
     # CPU Serial
     print("\nCPU:")
     if 'cpu_serial' in hwid_data:
-        cpu_data = parse_wmi_output(hwid_data['cpu_serial'])
+        cpu_data = parse_wmi_output(hwid_data['cpu_serial'], copy=False)
         if isinstance(cpu_data, dict) and 'SerialNumber' in cpu_data and cpu_data['SerialNumber'] != 'Unknown':
             print(f"  Serial: {cpu_data['SerialNumber']}")
         else:
@@ -753,28 +1243,28 @@ def display_core_hwid(hwid_data):
     # BIOS Serial
     print("\nBIOS:")
     if 'bios_serial' in hwid_data:
-        bios_data = parse_wmi_output(hwid_data['bios_serial'])
+        bios_data = parse_wmi_output(hwid_data['bios_serial'], copy=False)
         if isinstance(bios_data, dict) and 'SerialNumber' in bios_data:
             print(f"  Serial: {bios_data['SerialNumber']}")
     
     # Motherboard Serial
     print("\nMOTHERBOARD:")
     if 'motherboard_serial' in hwid_data:
-        mb_data = parse_wmi_output(hwid_data['motherboard_serial'])
+        mb_data = parse_wmi_output(hwid_data['motherboard_serial'], copy=False)
         if isinstance(mb_data, dict) and 'SerialNumber' in mb_data:
             print(f"  Serial: {mb_data['SerialNumber']}")
     
     # smBIOS UUID
     print("\nsmBIOS UUID:")
     if 'smbios_uuid' in hwid_data:
-        uuid_data = parse_wmi_output(hwid_data['smbios_uuid'])
+        uuid_data = parse_wmi_output(hwid_data['smbios_uuid'], copy=False)
         if isinstance(uuid_data, dict) and 'UUID' in uuid_data:
             print(f"  UUID: {uuid_data['UUID']}")
     
     # MAC Addresses
     print("\nMAC ADDRESSES:")
     if 'mac_addresses' in hwid_data:
-        mac_data = parse_wmi_output(hwid_data['mac_addresses'])
+        mac_data = parse_wmi_output(hwid_data['mac_addresses'], copy=False)
         if isinstance(mac_data, list):
             for i, adapter in enumerate(mac_data, 1):
                 if 'Name' in adapter and 'MacAddress' in adapter:
@@ -785,142 +1275,199 @@ def display_core_hwid(hwid_data):
     
     print("="*70)
 
+# HWID hashes only identify hardware, so a fast digest is enough. blake2b with a
+# 16 byte digest is quicker than md5 and keeps the same 32 character hashes.
+HWID_HASH_ALGORITHM = 'blake2b'
+
+def hash_hwid_components(combined, algorithm=HWID_HASH_ALGORITHM):
+    """Hash the combined HWID components, md5 is kept for reports saved by older versions"""
+    if algorithm == 'md5':
+        return hashlib.md5(combined.encode()).hexdigest()
+    return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
+
+# Core HWID values that make up the hash: (core key, property, several objects allowed)
+# Only disk drives take every object, other multi-object outputs are ignored as before
+_HWID_FIELDS = (
+    ('diskdrive', 'SerialNumber', True),
+    ('bios_serial', 'SerialNumber', False),
+    ('motherboard_serial', 'SerialNumber', False),
+    ('smbios_uuid', 'UUID', False),
+)
+
+# The same report is hashed by every comparison and ban check, memoize on the raw text
+@functools.lru_cache(maxsize=32)
+def hash_core_hwid(outputs, algorithm=HWID_HASH_ALGORITHM):
+    """Hash the core HWID query outputs, given in _HWID_FIELDS order with None for missing ones"""
+    # Extract key identifiers for comparison
+    key_components = []
+    for (key, field, multiple), wmi_text in zip(_HWID_FIELDS, outputs):
+        data = parse_wmi_output(wmi_text, copy=False)
+        if isinstance(data, dict):
+            if field in data:
+                key_components.append(data[field])
+        elif multiple:
+            key_components.extend(obj[field] for obj in data if field in obj)
+    
+    # Create hash from components
+    combined = '|'.join(sorted(key_components))
+    return hash_hwid_components(combined, algorithm)
+
 # HWID Report Manager
 class HWIDReportManager:
     def __init__(self, settings_manager, stats_manager=None):
-        self.data_dir = Path("data")
+        self.data_dir = DATA_DIR
         self.reports_dir = self.data_dir / "reports"
-        self.reports_dir.mkdir(exist_ok=True)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.settings = settings_manager
         self.stats_manager = stats_manager
-        self.logger = logging.getLogger(__name__)
         self.current_report_file = self.data_dir / "current_hwid.json"
-    
-    def generate_hwid_hash(self, hwid_data):
-        """Generate a unique hash from core HWID components"""
-        import hashlib
+        self._report_cache = None  # (mtime_ns, size, report) of the last load
+        self._report_files = None  # Backup reports oldest first, listed on first cleanup
+        self.refresh_settings()
+        self.migrate_banned_hashes()
+    
+    def refresh_settings(self):
+        """Re-read the settings used on every comparison"""
+        self._stats_enabled = self.settings.get('stats_tracking', True)
+    
+    def migrate_banned_hashes(self):
+        """Move banned and recorded hashes made with an older hash algorithm to the current one"""
+        algorithm = self.settings.get('hwid_hash_algorithm', 'md5')
+        if algorithm == HWID_HASH_ALGORITHM:
+            return
+        
+        # Old hashes can't be converted, except this machine's own which is
+        # rehashed from the stored report
+        current_report = self.load_current_report()
+        if current_report:
+            old_hash = self.generate_hwid_hash(current_report, algorithm)
+            new_hash = self.generate_hwid_hash(current_report)
+            if self.stats_manager:
+                # Otherwise the next check would count this machine as a new unique HWID
+                self.stats_manager.replace_hash(old_hash, new_hash)
         
-        # Extract key identifiers for comparison
-        key_components = []
+        banned_hwids = self.settings.get('banned_hwids', [])
+        if banned_hwids:
+            if current_report:
+                banned_hwids = [new_hash if h == old_hash else h for h in banned_hwids]
+                self.settings.set('banned_hwids', banned_hwids)
+            logger.warning(f"HWID hash algorithm changed from {algorithm} to {HWID_HASH_ALGORITHM}, "
+                           f"bans made for other hardware will no longer match")
         
-        if 'core_hwid' in hwid_data:
-            core = hwid_data['core_hwid']
-            
-            # Disk serial
-            if 'diskdrive' in core:
-                disk_data = parse_wmi_output(core['diskdrive'])
-                if isinstance(disk_data, dict) and 'SerialNumber' in disk_data:
-                    key_components.append(disk_data['SerialNumber'])
-                elif isinstance(disk_data, list):
-                    for disk in disk_data:
-                        if 'SerialNumber' in disk:
-                            key_components.append(disk['SerialNumber'])
-            
-            # BIOS serial
-            if 'bios_serial' in core:
-                bios_data = parse_wmi_output(core['bios_serial'])
-                if isinstance(bios_data, dict) and 'SerialNumber' in bios_data:
-                    key_components.append(bios_data['SerialNumber'])
-            
-            # Motherboard serial
-            if 'motherboard_serial' in core:
-                mb_data = parse_wmi_output(core['motherboard_serial'])
-                if isinstance(mb_data, dict) and 'SerialNumber' in mb_data:
-                    key_components.append(mb_data['SerialNumber'])
-            
-            # smBIOS UUID
-            if 'smbios_uuid' in core:
-                uuid_data = parse_wmi_output(core['smbios_uuid'])
-                if isinstance(uuid_data, dict) and 'UUID' in uuid_data:
-                    key_components.append(uuid_data['UUID'])
-        
-        # Create hash from components
-        combined = '|'.join(sorted(key_components))
-        return hashlib.md5(combined.encode()).hexdigest()
+        self.settings.set('hwid_hash_algorithm', HWID_HASH_ALGORITHM)
     
-    def save_report(self, hwid_data):
-        """Save HWID report to data folder"""
+    def generate_hwid_hash(self, hwid_data, algorithm=HWID_HASH_ALGORITHM):
+        """Generate a unique hash from core HWID components"""
+        core = hwid_data.get('core_hwid', {})
+        outputs = tuple(core.get(key) for key, _, _ in _HWID_FIELDS)
+        return hash_core_hwid(outputs, algorithm)
+    
+    def get_report_hash(self, report):
+        """Get a stored report's HWID hash, rehashing reports saved with an older algorithm"""
+        metadata = report.get('metadata', {})
+        if metadata.get('hash_algorithm', 'md5') == HWID_HASH_ALGORITHM:
+            return metadata.get('hwid_hash', '')
+        return self.generate_hwid_hash(report)
+    
+    def save_report(self, hwid_data, precomputed_hash=None):
+        """Save HWID report to data folder, precomputed_hash skips rehashing the data"""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            now = datetime.now()
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             
             # Add metadata
             hwid_data['metadata'] = {
                 'timestamp': timestamp,
-                'generated_date': datetime.now().isoformat(),
-                'hwid_hash': self.generate_hwid_hash(hwid_data)
+                'generated_date': now.isoformat(),
+                'hwid_hash': precomputed_hash or self.generate_hwid_hash(hwid_data),
+                'hash_algorithm': HWID_HASH_ALGORITHM
             }
             
+            # Serialize once, the backup is an identical copy
+            payload = json_dumps(hwid_data, default=str)
+            
             # Save current report (overwrites previous)
-            with open(self.current_report_file, 'w') as f:
-                json.dump(hwid_data, f, indent=2, default=str)
+            self.current_report_file.write_bytes(payload)
+            self._report_cache = None
             
             # Save timestamped report if backup is enabled
             if self.settings.get('backup_reports', True):
                 report_file = self.reports_dir / f'hwid_report_{timestamp}.json'
-                with open(report_file, 'w') as f:
-                    json.dump(hwid_data, f, indent=2, default=str)
+                report_file.write_bytes(payload)
                 
                 # Clean old reports if max limit exceeded
-                self.cleanup_old_reports()
+                self.cleanup_old_reports(report_file)
             
-            self.logger.info(f"HWID report saved: {timestamp}")
+            logger.info(f"HWID report saved: {timestamp}")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error saving HWID report: {e}")
+            logger.error(f"Error saving HWID report: {e}")
             return False
     
     def load_current_report(self):
-        """Load the current HWID report"""
+        """Load the current HWID report, reusing the last load while the file is unchanged"""
         try:
-            if self.current_report_file.exists():
-                with open(self.current_report_file, 'r') as f:
-                    return json.load(f)
-            return None
+            try:
+                stat = self.current_report_file.stat()
+            except FileNotFoundError:
+                self._report_cache = None
+                return None
+            
+            cache = self._report_cache
+            if cache and cache[0] == stat.st_mtime_ns and cache[1] == stat.st_size:
+                return cache[2]
+            
+            report = read_json(self.current_report_file)
+            self._report_cache = (stat.st_mtime_ns, stat.st_size, report)
+            return report
         except Exception as e:
-            self.logger.error(f"Error loading current report: {e}")
+            logger.error(f"Error loading current report: {e}")
             return None
     
     def compare_hwid(self, new_hwid_data):
-        """Compare new HWID with stored report"""
+        """Compare new HWID with stored report, returns (match, message, new_hash)"""
         current_report = self.load_current_report()
         new_hash = self.generate_hwid_hash(new_hwid_data)
         
         if not current_report:
-            self.logger.info("No previous HWID report found for comparison")
+            logger.info("No previous HWID report found for comparison")
             # Record this as first check if stats tracking is enabled
-            if self.stats_manager and self.settings.get('stats_tracking', True):
+            if self.stats_manager and self._stats_enabled:
                 self.stats_manager.record_check(new_hash, changed=False)
-            return None, "No previous report found"
+            return None, "No previous report found", new_hash
         
-        old_hash = current_report.get('metadata', {}).get('hwid_hash', '')
+        old_hash = self.get_report_hash(current_report)
         changed = new_hash != old_hash
         
         # Record the check in statistics
-        if self.stats_manager and self.settings.get('stats_tracking', True):
+        if self.stats_manager and self._stats_enabled:
             self.stats_manager.record_check(new_hash, changed=changed)
         
         if not changed:
-            self.logger.info("HWID comparison: No changes detected")
-            return True, "HWID matches previous report"
+            logger.info("HWID comparison: No changes detected")
+            return True, "HWID matches previous report", new_hash
         else:
-            self.logger.warning("HWID comparison: Changes detected!")
-            return False, "HWID has changed from previous report"
+            logger.warning("HWID comparison: Changes detected!")
+            return False, "HWID has changed from previous report", new_hash
     
-    def cleanup_old_reports(self):
-        """Remove old reports if exceeding max limit"""
+    def cleanup_old_reports(self, new_report=None):
+        """Remove old reports if exceeding max limit, new_report is the file just written"""
         max_reports = self.settings.get('max_reports', 10)
         
         try:
-            reports = list(self.reports_dir.glob('hwid_report_*.json'))
-            reports.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            if self._report_files is None:
+                # Timestamped names sort chronologically, no need to stat each file
+                self._report_files = sorted(self.reports_dir.glob('hwid_report_*.json'))
+            elif new_report is not None and new_report not in self._report_files[-1:]:
+                self._report_files.append(new_report)
             
-            if len(reports) > max_reports:
-                for old_report in reports[max_reports:]:
-                    old_report.unlink()
-                    self.logger.info(f"Removed old report: {old_report.name}")
+            while len(self._report_files) > max_reports:
+                old_report = self._report_files.pop(0)
+                old_report.unlink(missing_ok=True)
+                logger.info(f"Removed old report: {old_report.name}")
         except Exception as e:
-            self.logger.error(f"Error cleaning up old reports: {e}")
+            logger.error(f"Error cleaning up old reports: {e}")
 
 # Threaded Worker for Background Operations
 class HWIDWorker:
@@ -928,16 +1475,29 @@ class HWIDWorker:
         self.settings = settings_manager
         self.report_manager = report_manager
         self.stats_manager = stats_manager
-        self.logger = logging.getLogger(__name__)
         self.task_queue = queue.Queue()
-        self.result_queue = queue.Queue()
+        self._results = {}  # task_id -> result, guarded by _results_cond
+        self._results_cond = threading.Condition()
         self.worker_thread = None
         self.monitoring_thread = None
         self.running = False
         self.monitoring = False
+        self._stop_event = threading.Event()  # Wakes the monitoring loop when stopping
         self.current_task = None
         self.task_progress = ""
         self.last_monitoring_check = None
+        self._notifications = queue.Queue()  # Monitoring messages for the menu to print
+        self._hwid_cache = None  # Last collected HWID data and when it was collected
+        self._hwid_cache_ts = 0.0
+        self._hwid_cache_ttl = 5.0  # Seconds a collection is reused by following tasks
+        self._hwid_cache_lock = threading.Lock()
+        self._startup_snapshot = None  # (hwid_data, timestamp) from main, used once by collect/compare
+        self.refresh_settings()
+    
+    def refresh_settings(self):
+        """Re-read the settings used by the monitoring loop and handlers"""
+        self._interval = self.settings.get('monitoring_interval', 300)  # Default 5 minutes
+        self.report_manager.refresh_settings()
     
     def start_worker(self):
         """Start the background worker thread"""
@@ -945,7 +1505,7 @@ class HWIDWorker:
             self.running = True
             self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
             self.worker_thread.start()
-            self.logger.info("Background worker started")
+            logger.info("Background worker started")
             
             # Start monitoring if enabled
             if self.settings.get('background_monitoring', False):
@@ -955,41 +1515,48 @@ class HWIDWorker:
         """Start background HWID monitoring"""
         if not self.monitoring:
             self.monitoring = True
+            self._stop_event.clear()
             self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
             self.monitoring_thread.start()
-            self.logger.info("Background HWID monitoring started")
+            logger.info("Background HWID monitoring started")
     
     def stop_monitoring(self):
         """Stop background HWID monitoring"""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitoring_thread and self.monitoring_thread.is_alive():
             self.monitoring_thread.join(timeout=2)
-            self.logger.info("Background HWID monitoring stopped")
+            logger.info("Background HWID monitoring stopped")
     
     def stop_worker(self):
         """Stop the background worker thread"""
         self.running = False
         self.monitoring = False
+        self._stop_event.set()
+        self.task_queue.put({'type': '__stop__'})
         
         if self.worker_thread and self.worker_thread.is_alive():
             self.worker_thread.join(timeout=2)
-            self.logger.info("Background worker stopped")
+            logger.info("Background worker stopped")
         
         if self.monitoring_thread and self.monitoring_thread.is_alive():
             self.monitoring_thread.join(timeout=2)
-            self.logger.info("Background monitoring stopped")
+            logger.info("Background monitoring stopped")
     
     def _worker_loop(self):
         """Main worker loop that processes tasks"""
-        while self.running:
+        while True:
+            # Block until a task arrives, stop_worker queues a sentinel to exit
+            task = self.task_queue.get()
+            task_type = task.get('type')
+            task_id = task.get('id')
+            
+            if task_type == '__stop__':
+                break
+            
             try:
-                # Check for new tasks
-                task = self.task_queue.get(timeout=0.1)
                 self.current_task = task
                 
-                task_type = task.get('type')
-                task_id = task.get('id')
-                
                 if task_type == 'collect_hwid':
                     self._handle_collect_hwid(task_id)
                 elif task_type == 'compare_hwid':
@@ -1004,12 +1571,10 @@ class HWIDWorker:
                 self.current_task = None
                 self.task_progress = ""
                 
-            except queue.Empty:
-                continue
             except Exception as e:
-                self.logger.error(f"Worker error: {e}")
-                self.result_queue.put({
-                    'id': task_id if 'task_id' in locals() else 'unknown',
+                logger.error(f"Worker error: {e}")
+                self._post_result({
+                    'id': task_id,
                     'status': 'error',
                     'error': str(e)
                 })
@@ -1018,63 +1583,89 @@ class HWIDWorker:
         """Background monitoring loop that periodically checks HWID"""
         while self.monitoring and self.running:
             try:
-                interval = self.settings.get('monitoring_interval', 300)  # Default 5 minutes
-                
-                # Wait for the interval
-                for _ in range(interval):
-                    if not self.monitoring or not self.running:
-                        break
-                    time.sleep(1)
-                
-                if not self.monitoring or not self.running:
+                # Wait for the interval, returns early if monitoring is stopped
+                if self._stop_event.wait(timeout=self._interval):
                     break
                 
                 # Perform HWID check
-                self.logger.info("Performing scheduled HWID check...")
+                logger.info("Performing scheduled HWID check...")
                 self.last_monitoring_check = datetime.now()
                 
                 hwid_data = collect_hwid_data()
                 if hwid_data:
-                    match, message = self.report_manager.compare_hwid(hwid_data)
+                    match, message, new_hash = self.report_manager.compare_hwid(hwid_data)
                     
                     if match is False:  # HWID changed
-                        self.logger.warning(f"Scheduled check detected HWID change: {message}")
-                        # Save the new HWID report
-                        self.report_manager.save_report(hwid_data)
+                        logger.warning(f"Scheduled check detected HWID change: {message}")
+                        self._notifications.put(f"[!] Scheduled check: {message}")
+                        # Save the new HWID report, reusing the hash from the comparison
+                        self.report_manager.save_report(hwid_data, precomputed_hash=new_hash)
                     elif match is True:  # No change
-                        self.logger.info("Scheduled check: No HWID changes detected")
+                        logger.info("Scheduled check: No HWID changes detected")
                     else:  # First check
-                        self.logger.info("Scheduled check: First HWID recorded")
-                        self.report_manager.save_report(hwid_data)
+                        logger.info("Scheduled check: First HWID recorded")
+                        self._notifications.put("Scheduled check: First HWID recorded")
+                        self.report_manager.save_report(hwid_data, precomputed_hash=new_hash)
                 
             except Exception as e:
-                self.logger.error(f"Monitoring error: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                logger.error(f"Monitoring error: {e}")
+                if self._stop_event.wait(timeout=60):  # Wait 1 minute before retrying
+                    break
+    
+    def _fresh_hwid(self):
+        """Collect HWID data, reusing a collection from the last few seconds"""
+        with self._hwid_cache_lock:
+            now = time.monotonic()
+            if self._hwid_cache and now - self._hwid_cache_ts < self._hwid_cache_ttl:
+                return self._hwid_cache
+            
+            hwid_data = collect_hwid_data()
+            if hwid_data:
+                self._hwid_cache, self._hwid_cache_ts = hwid_data, time.monotonic()
+            return hwid_data
+    
+    def seed_initial_snapshot(self, hwid_data):
+        """Let the next collect or compare task reuse the startup collection"""
+        with self._hwid_cache_lock:
+            self._startup_snapshot = (hwid_data, time.monotonic())
+    
+    def _take_startup_snapshot(self):
+        """Return the startup collection once, if it is still recent enough"""
+        with self._hwid_cache_lock:
+            snapshot, self._startup_snapshot = self._startup_snapshot, None
+        if snapshot and time.monotonic() - snapshot[1] < self._hwid_cache_ttl:
+            return snapshot[0]
+        return None
+    
+    def invalidate_hwid_cache(self):
+        """Force the next task to perform a fresh collection"""
+        with self._hwid_cache_lock:
+            self._hwid_cache = None
     
     def _handle_collect_hwid(self, task_id):
         """Handle HWID collection in background"""
         try:
             self.task_progress = "Collecting HWID data..."
-            hwid_data = collect_hwid_data()
+            hwid_data = self._take_startup_snapshot() or self._fresh_hwid()
             
             if hwid_data:
                 self.task_progress = "Saving report..."
                 success = self.report_manager.save_report(hwid_data)
                 
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'success',
                     'data': hwid_data,
                     'saved': success
                 })
             else:
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
                     'error': 'Failed to collect HWID data'
                 })
         except Exception as e:
-            self.result_queue.put({
+            self._post_result({
                 'id': task_id,
                 'status': 'error',
                 'error': str(e)
@@ -1084,40 +1675,40 @@ class HWIDWorker:
         """Handle HWID comparison in background"""
         try:
             self.task_progress = "Collecting current HWID..."
-            hwid_data = collect_hwid_data()
+            hwid_data = self._take_startup_snapshot() or self._fresh_hwid()
             
             if hwid_data:
                 self.task_progress = "Comparing with previous report..."
-                match, message = self.report_manager.compare_hwid(hwid_data)
+                match, message, _ = self.report_manager.compare_hwid(hwid_data)
                 
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'success',
                     'match': match,
                     'message': message
                 })
             else:
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
                     'error': 'Failed to collect HWID data for comparison'
                 })
         except Exception as e:
-            self.result_queue.put({
+            self._post_result({
                 'id': task_id,
                 'status': 'error',
                 'error': str(e)
             })
     
     def _handle_ban_current_hwid(self, task_id):
-        """Handle banning current HWID in background - performs live scan"""
+        """Handle banning current HWID in background from a recent scan"""
         try:
-            # Always perform a live scan to get the current HWID
+            # Scan for the current HWID, reusing a collection from the last few seconds
             self.task_progress = "Performing live scan to get current HWID..."
-            hwid_data = collect_hwid_data()
+            hwid_data = self._fresh_hwid()
             
             if not hwid_data:
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
                     'error': 'Failed to collect current HWID data'
@@ -1126,7 +1717,7 @@ class HWIDWorker:
             
             self.task_progress = "Saving HWID report..."
             if not self.report_manager.save_report(hwid_data):
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
                     'error': 'Failed to save HWID report'
@@ -1134,30 +1725,26 @@ class HWIDWorker:
                 return
             
             self.task_progress = "Adding HWID to ban list..."
-            hwid_hash = self.report_manager.generate_hwid_hash(hwid_data)
+            # save_report already hashed the data into the report metadata
+            hwid_hash = hwid_data['metadata']['hwid_hash']
             
             if not hwid_hash:
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
                     'error': 'Failed to generate HWID hash from current data'
                 })
                 return
             
-            banned_hwids = self.settings.get('banned_hwids', [])
-            
-            if hwid_hash in banned_hwids:
-                self.result_queue.put({
+            if not self.settings.add_banned_hwid(hwid_hash):
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
                     'error': 'HWID is already banned'
                 })
                 return
             
-            banned_hwids.append(hwid_hash)
-            self.settings.set('banned_hwids', banned_hwids)
-            
-            self.result_queue.put({
+            self._post_result({
                 'id': task_id,
                 'status': 'success',
                 'message': f'Current HWID has been banned (Hash: {hwid_hash[:8]}...{hwid_hash[-8:]})',
@@ -1165,40 +1752,43 @@ class HWIDWorker:
             })
             
         except Exception as e:
-            self.result_queue.put({
+            self._post_result({
                 'id': task_id,
                 'status': 'error',
                 'error': str(e)
             })
     
     def _handle_anticheat_test(self, task_id):
-        """Handle anti-cheat test in background"""
+        """Handle anti-cheat test in background - Always performs fresh HWID scan"""
         try:
-            self.task_progress = "Performing anti-cheat scan..."
-            hwid_data = collect_hwid_data()
+            self.task_progress = "Scanning hardware fingerprint..."
+            
+            # Always rescan like a real anti-cheat, a recent collection is not reused
+            self.invalidate_hwid_cache()
+            hwid_data = self._fresh_hwid()
             
             if not hwid_data:
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
-                    'error': 'Failed to collect HWID data for anti-cheat test'
+                    'error': 'Failed to collect HWID data for anti-cheat scan'
                 })
                 return
             
+            self.task_progress = "Checking against ban database..."
             hwid_hash = self.report_manager.generate_hwid_hash(hwid_data)
-            banned_hwids = self.settings.get('banned_hwids', [])
-            is_banned = hwid_hash in banned_hwids
+            is_banned = self.settings.is_hwid_banned(hwid_hash)
             
-            self.result_queue.put({
+            self._post_result({
                 'id': task_id,
                 'status': 'success',
                 'is_banned': is_banned,
                 'hwid_hash': hwid_hash,
-                'scan_type': 'live'
+                'scan_type': 'fresh_scan'
             })
             
         except Exception as e:
-            self.result_queue.put({
+            self._post_result({
                 'id': task_id,
                 'status': 'error',
                 'error': str(e)
@@ -1208,91 +1798,24 @@ class HWIDWorker:
         """Handle showing HWID statistics"""
         try:
             if self.stats_manager:
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'success',
                     'stats': self.stats_manager.stats
                 })
             else:
-                self.result_queue.put({
+                self._post_result({
                     'id': task_id,
                     'status': 'error',
                     'error': 'Statistics manager not available'
                 })
         except Exception as e:
-            self.result_queue.put({
-                'id': task_id,
-                'status': 'error',
-                'error': str(e)
-            })
-            
-            banned_hwids.append(hwid_hash)
-            self.settings.set('banned_hwids', banned_hwids)
-            
-            self.result_queue.put({
-                'id': task_id,
-                'status': 'success',
-                'message': f'HWID {hwid_hash[:8]}... has been banned'
-            })
-            
-        except Exception as e:
-            self.result_queue.put({
-                'id': task_id,
-                'status': 'error',
-                'error': str(e)
-            })
-    
-    def _handle_anticheat_test(self, task_id):
-        """Handle anti-cheat test in background - Always performs fresh HWID scan"""
-        try:
-            self.task_progress = "Initializing anti-cheat system..."
-            time.sleep(0.5)  # Simulate initialization
-            
-            self.task_progress = "Scanning hardware fingerprint..."
-            time.sleep(1)  # Simulate scan time
-            
-            # ALWAYS perform fresh HWID scan (like real anti-cheat)
-            hwid_data = collect_hwid_data()
-            
-            if not hwid_data:
-                self.result_queue.put({
-                    'id': task_id,
-                    'status': 'error',
-                    'error': 'Failed to collect HWID data for anti-cheat scan'
-                })
-                return
-            
-            self.task_progress = "Generating hardware fingerprint..."
-            time.sleep(0.5)
-            
-            # Generate HWID hash for comparison
-            hwid_hash = self.report_manager.generate_hwid_hash(hwid_data)
-            
-            self.task_progress = "Checking against ban database..."
-            time.sleep(1)  # Simulate database check
-            
-            banned_hwids = self.settings.get('banned_hwids', [])
-            is_banned = hwid_hash in banned_hwids
-            
-            self.task_progress = "Finalizing anti-cheat verification..."
-            time.sleep(0.5)
-            
-            self.result_queue.put({
-                'id': task_id,
-                'status': 'success',
-                'is_banned': is_banned,
-                'hwid_hash': hwid_hash,
-                'scan_type': 'fresh_scan'
-            })
-            
-        except Exception as e:
-            self.result_queue.put({
+            self._post_result({
                 'id': task_id,
                 'status': 'error',
                 'error': str(e)
             })
     
-
     def submit_task(self, task_type, task_id=None):
         """Submit a task to the worker queue"""
         if task_id is None:
@@ -1308,16 +1831,25 @@ class HWIDWorker:
         return task_id
     
     def get_result(self, task_id, timeout=0.1):
-        """Get result for a specific task"""
-        try:
-            while True:
-                result = self.result_queue.get(timeout=timeout)
-                if result.get('id') == task_id:
-                    return result
-                # Put back results for other tasks
-                self.result_queue.put(result)
-        except queue.Empty:
-            return None
+        """Get result for a specific task, waiting up to timeout seconds"""
+        with self._results_cond:
+            self._results_cond.wait_for(lambda: task_id in self._results, timeout=timeout)
+            return self._results.pop(task_id, None)
+    
+    def _post_result(self, result):
+        """Store a task result and wake anyone waiting for it"""
+        with self._results_cond:
+            self._results[result.get('id')] = result
+            self._results_cond.notify_all()
+    
+    def drain_notifications(self):
+        """Get the monitoring messages queued since the last call"""
+        messages = []
+        while True:
+            try:
+                messages.append(self._notifications.get_nowait())
+            except queue.Empty:
+                return messages
     
     def is_working(self):
         """Check if worker is currently processing a task"""
@@ -1332,7 +1864,6 @@ class HWIDBanManager:
     def __init__(self, settings_manager, report_manager):
         self.settings = settings_manager
         self.report_manager = report_manager
-        self.logger = logging.getLogger(__name__)
     
     def is_hwid_banned(self, hwid_hash=None):
         """Check if current or specified HWID is banned"""
@@ -1361,11 +1892,9 @@ class HWIDBanManager:
                 
                 print("New HWID report generated for check!")
             
-            hwid_hash = current_report.get('metadata', {}).get('hwid_hash', '')
-        
-        banned_hwids = self.settings.get('banned_hwids', [])
+            hwid_hash = self.report_manager.get_report_hash(current_report)
         
-        if hwid_hash in banned_hwids:
+        if self.settings.is_hwid_banned(hwid_hash):
             return True, f"HWID {hwid_hash[:8]}... is BANNED"
         else:
             return False, f"HWID {hwid_hash[:8]}... is clean"
@@ -1385,48 +1914,33 @@ class HWIDBanManager:
         if not self.report_manager.save_report(hwid_data):
             return False, "Failed to save HWID report"
         
-        # Get the hash from the newly collected data
-        hwid_hash = self.report_manager.generate_hwid_hash(hwid_data)
+        # Get the hash save_report stored for the newly collected data
+        hwid_hash = hwid_data['metadata']['hwid_hash']
         if not hwid_hash:
             return False, "Failed to generate HWID hash from current data"
         
         print(f"Current HWID hash: {hwid_hash[:8]}...")
         
-        banned_hwids = self.settings.get('banned_hwids', [])
-        
-        if hwid_hash in banned_hwids:
+        if not self.settings.add_banned_hwid(hwid_hash):
             return False, f"HWID {hwid_hash[:8]}... is already banned"
         
-        banned_hwids.append(hwid_hash)
-        self.settings.set('banned_hwids', banned_hwids)
-        
-        self.logger.info(f"HWID banned: {hwid_hash[:8]}...")
+        logger.info(f"HWID banned: {hwid_hash[:8]}...")
         return True, f"HWID {hwid_hash[:8]}... has been banned"
     
     def ban_hwid_by_hash(self, hwid_hash):
         """Ban a specific HWID by hash"""
-        banned_hwids = self.settings.get('banned_hwids', [])
-        
-        if hwid_hash in banned_hwids:
+        if not self.settings.add_banned_hwid(hwid_hash):
             return False, f"HWID {hwid_hash[:8]}... is already banned"
         
-        banned_hwids.append(hwid_hash)
-        self.settings.set('banned_hwids', banned_hwids)
-        
-        self.logger.info(f"HWID banned manually: {hwid_hash[:8]}...")
+        logger.info(f"HWID banned manually: {hwid_hash[:8]}...")
         return True, f"HWID {hwid_hash[:8]}... has been banned"
     
     def unban_hwid(self, hwid_hash):
         """Unban a specific HWID"""
-        banned_hwids = self.settings.get('banned_hwids', [])
-        
-        if hwid_hash not in banned_hwids:
+        if not self.settings.remove_banned_hwid(hwid_hash):
             return False, f"HWID {hwid_hash[:8]}... is not banned"
         
-        banned_hwids.remove(hwid_hash)
-        self.settings.set('banned_hwids', banned_hwids)
-        
-        self.logger.info(f"HWID unbanned: {hwid_hash[:8]}...")
+        logger.info(f"HWID unbanned: {hwid_hash[:8]}...")
         return True, f"HWID {hwid_hash[:8]}... has been unbanned"
     
     def clear_all_bans(self):
@@ -1434,7 +1948,7 @@ class HWIDBanManager:
         banned_count = len(self.settings.get('banned_hwids', []))
         self.settings.set('banned_hwids', [])
         
-        self.logger.info("All HWID bans cleared")
+        logger.info("All HWID bans cleared")
         return True, f"Cleared {banned_count} banned HWIDs"
     
     def get_banned_hwids(self):
@@ -1443,9 +1957,9 @@ class HWIDBanManager:
     
     def run_anticheat_test(self):
         """Simulate an anti-cheat check"""
-        print("\n" + "="*60)
+        print("\n" + BAR60)
         print("           ANTI-CHEAT SIMULATOR")
-        print("="*60)
+        print(BAR60)
         print()
         print("Initializing anti-cheat system...")
         print("Scanning hardware fingerprint...")
@@ -1474,19 +1988,156 @@ class HWIDBanManager:
             print()
             print("Welcome! Your system is clean and ready to play.")
         
-        print("="*60)
+        print(BAR60)
         return is_banned
 
+def write_console(text):
+    """Write text to stdout with a single os.write, bypassing the text layer"""
+    try:
+        fd = None if IS_WINDOWS else sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a real file (e.g. redirected to a StringIO)
+        fd = None
+    
+    if fd is None:
+        # Windows keeps the text layer: the console reads raw bytes in its own
+        # code page, and redirected output needs the \r\n translation
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    
+    # Anything already buffered has to come out first to keep the order
+    sys.stdout.flush()
+    data = text.encode(sys.stdout.encoding or 'utf-8', errors='replace')
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+def render(lines):
+    """Write a block of lines to the console in a single write"""
+    write_console("\n".join(lines) + "\n")
+
 def clear_screen():
     """Clear the console screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    os.system('cls' if IS_WINDOWS else 'clear')
+
+def read_stdin_char(decoder):
+    """Read one character straight from the stdin fd, returns '' at end of input
+    
+    Reading byte by byte leaves anything typed ahead in the terminal, where
+    select() and later input() calls still see it.
+    """
+    fd = sys.stdin.fileno()
+    char = ''
+    while not char:
+        data = os.read(fd, 1)
+        if not data:
+            return ''
+        char = decoder.decode(data)
+    return char
+
+def stdin_decoder():
+    """Get an incremental decoder for bytes read from the stdin fd"""
+    return codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')(errors='replace')
+
+def poll_input(prompt, worker=None):
+    """Read a line like input(), printing worker notifications above the prompt while waiting"""
+    if worker is None or not sys.stdin.isatty():
+        return input(prompt)
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    prompt_line = prompt.rsplit('\n', 1)[-1]
+    typed = []  # Characters read so far on Windows, where echo is done here
+    
+    while True:
+        messages = worker.drain_notifications()
+        if messages:
+            # Clear the prompt line, print the messages, then redraw the prompt
+            if msvcrt:
+                # Legacy consoles don't understand ANSI codes, overwrite with spaces
+                sys.stdout.write('\r' + ' ' * (len(prompt_line) + len(typed)) + '\r')
+            else:
+                # The terminal echoed what was typed, so the line length is unknown here
+                sys.stdout.write('\r\x1b[2K')
+            sys.stdout.write(''.join(f"{message}\n" for message in messages))
+            sys.stdout.write(prompt_line + ''.join(typed))
+            sys.stdout.flush()
+        
+        if msvcrt:
+            deadline = time.monotonic() + 0.25
+            while time.monotonic() < deadline:
+                if not msvcrt.kbhit():
+                    time.sleep(0.02)
+                    continue
+                char = msvcrt.getwch()
+                if char in ('\r', '\n'):
+                    sys.stdout.write('\n')
+                    sys.stdout.flush()
+                    return ''.join(typed)
+                elif char == '\x03':
+                    raise KeyboardInterrupt
+                elif char == '\x08':
+                    if typed:
+                        typed.pop()
+                        sys.stdout.write('\b \b')
+                elif char in ('\x00', '\xe0'):
+                    msvcrt.getwch()  # Skip the second half of arrow and function keys
+                else:
+                    typed.append(char)
+                    sys.stdout.write(char)
+                sys.stdout.flush()
+        else:
+            ready, _, _ = select.select([sys.stdin.fileno()], [], [], 0.25)
+            if ready:
+                # Bypass sys.stdin's buffer, which would swallow lines typed ahead
+                decoder = stdin_decoder()
+                chars = []
+                while True:
+                    char = read_stdin_char(decoder)
+                    if not char:
+                        if not chars:
+                            raise EOFError
+                        break
+                    if char == '\n':
+                        break
+                    chars.append(char)
+                return ''.join(chars)
+
+def getch_yn(prompt):
+    """Ask a y/N question answered with a single keypress, returns True for y"""
+    if not sys.stdin.isatty() or (msvcrt is None and termios is None):
+        return input(prompt).strip().lower() == 'y'
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    
+    if msvcrt:
+        char = msvcrt.getwch()
+        if char == '\x03':
+            raise KeyboardInterrupt
+    else:
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd, termios.TCSANOW)  # The default TCSAFLUSH drops keys typed ahead
+            # Read from the fd so keys typed ahead stay available to select()
+            char = read_stdin_char(stdin_decoder())
+            if not char:
+                raise EOFError
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    
+    sys.stdout.write((char if char.isprintable() else '') + '\n')
+    sys.stdout.flush()
+    return char.lower() == 'y'
 
 def show_main_menu(monitoring_active=False, stats_summary=None):
     """Display the main menu"""
     clear_screen()
-    print("=" * 60)
+    print(BAR60)
     print("              EVADERS HWID")
-    print("=" * 60)
+    print(BAR60)
     
     # Show monitoring status
     if monitoring_active:
@@ -1506,65 +2157,68 @@ def show_main_menu(monitoring_active=False, stats_summary=None):
     print("7. View Logs")
     print("8. Exit")
     print()
-    print("=" * 60)
+    print(BAR60)
+
+# Settings menu options that simply flip a boolean: choice -> (setting key, label)
+SETTING_TOGGLES = {
+    '1': ('auto_save_reports', 'Auto-save reports'),
+    '2': ('compare_on_startup', 'Compare on startup'),
+    '3': ('detailed_logging', 'Detailed logging'),
+    '4': ('backup_reports', 'Backup reports'),
+    '6': ('ban_simulator_enabled', 'Ban simulator enabled'),
+    '9': ('stats_tracking', 'Statistics tracking'),
+}
 
 def show_settings_menu(settings_manager, worker=None, startup_manager=None):
     """Display and handle settings menu"""
+    auto_start_available = startup_manager is not None and IS_WINDOWS
+    auto_start_status = None  # Registry value, read once per visit and again after a change
+    
     while True:
         clear_screen()
-        print("=" * 60)
-        print("           SETTINGS")
-        print("=" * 60)
-        print()
-        print(f"1. Auto-save reports: {settings_manager.get('auto_save_reports')}")
-        print(f"2. Compare on startup: {settings_manager.get('compare_on_startup')}")
-        print(f"3. Detailed logging: {settings_manager.get('detailed_logging')}")
-        print(f"4. Backup reports: {settings_manager.get('backup_reports')}")
-        print(f"5. Max reports to keep: {settings_manager.get('max_reports')}")
-        print(f"6. Ban simulator enabled: {settings_manager.get('ban_simulator_enabled')}")
-        print(f"7. Background monitoring: {settings_manager.get('background_monitoring')}")
-        print(f"8. Monitoring interval: {settings_manager.get('monitoring_interval')} seconds")
-        print(f"9. Statistics tracking: {settings_manager.get('stats_tracking')}")
+        if auto_start_available and auto_start_status is None:
+            auto_start_status = startup_manager.is_auto_start_enabled()
+        
+        buf = [
+            BAR60,
+            "           SETTINGS",
+            BAR60,
+            "",
+            f"1. Auto-save reports: {settings_manager.get('auto_save_reports')}",
+            f"2. Compare on startup: {settings_manager.get('compare_on_startup')}",
+            f"3. Detailed logging: {settings_manager.get('detailed_logging')}",
+            f"4. Backup reports: {settings_manager.get('backup_reports')}",
+            f"5. Max reports to keep: {settings_manager.get('max_reports')}",
+            f"6. Ban simulator enabled: {settings_manager.get('ban_simulator_enabled')}",
+            f"7. Background monitoring: {settings_manager.get('background_monitoring')}",
+            f"8. Monitoring interval: {settings_manager.get('monitoring_interval')} seconds",
+            f"9. Statistics tracking: {settings_manager.get('stats_tracking')}",
+        ]
         
         # Show auto-start status
-        if startup_manager and startup_manager.is_windows():
-            auto_start_status = startup_manager.is_auto_start_enabled()
-            print(f"10. Auto-start with Windows: {auto_start_status}")
-            print("11. Back to Main Menu")
+        if auto_start_available:
+            buf.append(f"10. Auto-start with Windows: {auto_start_status}")
+            buf.append("11. Back to Main Menu")
             max_option = 11
         else:
-            print("10. Auto-start with Windows: Not available (Windows only)")
-            print("11. Back to Main Menu")
+            buf.append("10. Auto-start with Windows: Not available (Windows only)")
+            buf.append("11. Back to Main Menu")
             max_option = 11
         
-        print()
-        print("=" * 60)
+        buf.append("")
+        buf.append(BAR60)
+        render(buf)
         
         choice = input(f"Select option (1-{max_option}): ").strip()
         
-        if choice == '1':
-            current = settings_manager.get('auto_save_reports')
-            settings_manager.set('auto_save_reports', not current)
-            print(f"Auto-save reports set to: {not current}")
-            input("Press Enter to continue...")
-        
-        elif choice == '2':
-            current = settings_manager.get('compare_on_startup')
-            settings_manager.set('compare_on_startup', not current)
-            print(f"Compare on startup set to: {not current}")
-            input("Press Enter to continue...")
-        
-        elif choice == '3':
-            current = settings_manager.get('detailed_logging')
-            settings_manager.set('detailed_logging', not current)
-            print(f"Detailed logging set to: {not current}")
-            input("Press Enter to continue...")
-        
-        elif choice == '4':
-            current = settings_manager.get('backup_reports')
-            settings_manager.set('backup_reports', not current)
-            print(f"Backup reports set to: {not current}")
-            input("Press Enter to continue...")
+        if choice in SETTING_TOGGLES:
+            key, label = SETTING_TOGGLES[choice]
+            new_value = not settings_manager.get(key)
+            settings_manager.set(key, new_value)
+            if worker:
+                worker.refresh_settings()
+            print(f"{label} set to: {new_value}")
+            poll_input("Press Enter to continue...", worker)
         
         elif choice == '5':
             try:
@@ -1574,16 +2228,10 @@ def show_settings_menu(settings_manager, worker=None, startup_manager=None):
                     print(f"Max reports set to: {new_max}")
                 else:
                     print("Please enter a positive number")
-                input("Press Enter to continue...")
+                poll_input("Press Enter to continue...", worker)
             except ValueError:
                 print("Please enter a valid number")
-                input("Press Enter to continue...")
-        
-        elif choice == '6':
-            current = settings_manager.get('ban_simulator_enabled')
-            settings_manager.set('ban_simulator_enabled', not current)
-            print(f"Ban simulator enabled set to: {not current}")
-            input("Press Enter to continue...")
+                poll_input("Press Enter to continue...", worker)
         
         elif choice == '7':
             current = settings_manager.get('background_monitoring')
@@ -1599,7 +2247,7 @@ def show_settings_menu(settings_manager, worker=None, startup_manager=None):
                     print("Background monitoring disabled and stopped")
             else:
                 print(f"Background monitoring set to: {new_value}")
-            input("Press Enter to continue...")
+            poll_input("Press Enter to continue...", worker)
         
         elif choice == '8':
             try:
@@ -1607,45 +2255,39 @@ def show_settings_menu(settings_manager, worker=None, startup_manager=None):
                 new_interval = int(input(f"Enter monitoring interval in seconds (current: {current_interval}): "))
                 if new_interval >= 60:  # Minimum 1 minute
                     settings_manager.set('monitoring_interval', new_interval)
+                    if worker:
+                        worker.refresh_settings()
                     print(f"Monitoring interval set to: {new_interval} seconds")
                 else:
                     print("Minimum interval is 60 seconds")
-                input("Press Enter to continue...")
+                poll_input("Press Enter to continue...", worker)
             except ValueError:
                 print("Please enter a valid number")
-                input("Press Enter to continue...")
-        
-        elif choice == '9':
-            current = settings_manager.get('stats_tracking')
-            settings_manager.set('stats_tracking', not current)
-            print(f"Statistics tracking set to: {not current}")
-            input("Press Enter to continue...")
+                poll_input("Press Enter to continue...", worker)
         
         elif choice == '10':
             # Auto-start with Windows
-            if startup_manager and startup_manager.is_windows():
-                current_status = startup_manager.is_auto_start_enabled()
-                
-                if current_status:
+            if auto_start_available:
+                if auto_start_status:
                     # Currently enabled, ask to disable
-                    confirm = input("Auto-start is currently ENABLED. Disable it? (y/N): ").strip().lower()
-                    if confirm == 'y':
+                    if getch_yn("Auto-start is currently ENABLED. Disable it? (y/N): "):
                         success, message = startup_manager.disable_auto_start()
                         print(f"\n{message}")
                         if success:
                             settings_manager.set('auto_start_windows', False)
+                            auto_start_status = None
                 else:
                     # Currently disabled, ask to enable
-                    confirm = input("Auto-start is currently DISABLED. Enable it? (y/N): ").strip().lower()
-                    if confirm == 'y':
+                    if getch_yn("Auto-start is currently DISABLED. Enable it? (y/N): "):
                         success, message = startup_manager.enable_auto_start()
                         print(f"\n{message}")
                         if success:
                             settings_manager.set('auto_start_windows', True)
+                            auto_start_status = None
             else:
                 print("\nAuto-start with Windows is only available on Windows systems.")
             
-            input("Press Enter to continue...")
+            poll_input("Press Enter to continue...", worker)
         
         elif choice == '11':
             break
@@ -1653,19 +2295,19 @@ def show_settings_menu(settings_manager, worker=None, startup_manager=None):
 def show_progress_and_wait(worker, task_id, operation_name):
     """Show progress while waiting for a background task to complete"""
     print(f"\n{operation_name}...")
+    shown_progress = ""
     
     while True:
-        if worker.is_working():
-            progress = worker.get_progress()
-            if progress:
-                print(f"\r{progress}...", end="", flush=True)
-        
-        result = worker.get_result(task_id, timeout=0.5)
+        # Returns as soon as the worker posts the result, otherwise redraw progress
+        result = worker.get_result(task_id, timeout=0.25)
         if result:
             print()  # New line after progress
             return result
         
-        time.sleep(0.1)
+        progress = worker.get_progress()
+        if progress and progress != shown_progress:
+            print(f"\r{progress}...", end="", flush=True)
+            shown_progress = progress
 
 def threaded_collect_hwid(worker, settings_manager, report_manager):
     """Collect HWID data using background worker"""
@@ -1697,19 +2339,21 @@ def threaded_compare_hwid(worker):
         match = result['match']
         message = result['message']
         
-        print("\n" + "="*50)
-        print("           HWID COMPARISON RESULT")
-        print("="*50)
-        
         if match is None:
-            print("Status: No previous report to compare")
+            status = "Status: No previous report to compare"
         elif match:
-            print("Status: HWID MATCHES - No changes detected")
+            status = "Status: HWID MATCHES - No changes detected"
         else:
-            print("Status: HWID CHANGED - Hardware changes detected!")
-        
-        print(f"Details: {message}")
-        print("="*50)
+            status = "Status: HWID CHANGED - Hardware changes detected!"
+        
+        render([
+            "\n" + BAR50,
+            "           HWID COMPARISON RESULT",
+            BAR50,
+            status,
+            f"Details: {message}",
+            BAR50,
+        ])
         return True
     else:
         print(f"\nError: {result.get('error', 'Unknown error')}")
@@ -1728,11 +2372,50 @@ def threaded_ban_current_hwid(worker):
         return False
 
 
+# Anti-cheat result screens, built once, {head} and {tail} are the ends of the HWID hash
+_ANTICHEAT_HEADER = ["\n" + BAR50, "      ANTI-CHEAT VERIFICATION COMPLETE", BAR50]
+_ANTICHEAT_FOOTER = ["\n" + BAR50]
+ANTICHEAT_BANNED_TEMPLATE = "\n".join(_ANTICHEAT_HEADER + [
+    "",
+    "[!] HARDWARE BAN DETECTED",
+    DASH30,
+    "STATUS: BANNED",
+    "HWID: {head}...{tail}",
+    "SCAN TYPE: Fresh hardware fingerprint",
+    "BAN WAVE: Hardware flagged in database",
+    "ACTION: Access denied",
+    DASH30,
+    "",
+    "WARNING: Your hardware fingerprint has been detected",
+    "         in our anti-cheat ban database.",
+    "",
+    "SUPPORT: If you believe this is an error, contact support",
+    "         with your HWID for manual review.",
+    "",
+    "NOTE: Hardware bans are permanent and cannot",
+    "      be bypassed by reinstalling the game.",
+] + _ANTICHEAT_FOOTER) + "\n"
+ANTICHEAT_CLEAN_TEMPLATE = "\n".join(_ANTICHEAT_HEADER + [
+    "",
+    "[OK] HARDWARE VERIFICATION PASSED",
+    DASH30,
+    "STATUS: CLEAN",
+    "HWID: {head}...{tail}",
+    "SCAN TYPE: Fresh hardware fingerprint",
+    "BAN WAVE: No matches found in database",
+    "ACTION: Access granted",
+    DASH30,
+    "",
+    "SUCCESS: Welcome! Your system passed all anti-cheat checks.",
+    "VERIFIED: Hardware fingerprint verified as clean.",
+    "READY: You're ready to play!",
+] + _ANTICHEAT_FOOTER) + "\n"
+
 def threaded_anticheat_test(worker):
     """Run anti-cheat test using background worker"""
-    print("\n" + "="*60)
+    print("\n" + BAR60)
     print("           ANTI-CHEAT SIMULATOR")
-    print("="*60)
+    print(BAR60)
     print()
     print(">> Starting anti-cheat verification process...")
     print(">> This will perform a fresh hardware scan")
@@ -1747,45 +2430,8 @@ def threaded_anticheat_test(worker):
         hwid_hash = result['hwid_hash']
         scan_type = result.get('scan_type', 'unknown')
         
-        print("\n" + "="*50)
-        print("      ANTI-CHEAT VERIFICATION COMPLETE")
-        print("="*50)
-        
-        if is_banned:
-            print()
-            print("[!] HARDWARE BAN DETECTED")
-            print("-" * 30)
-            print("STATUS: BANNED")
-            print(f"HWID: {hwid_hash[:12]}...{hwid_hash[-12:]}")
-            print("SCAN TYPE: Fresh hardware fingerprint")
-            print("BAN WAVE: Hardware flagged in database")
-            print("ACTION: Access denied")
-            print("-" * 30)
-            print()
-            print("WARNING: Your hardware fingerprint has been detected")
-            print("         in our anti-cheat ban database.")
-            print()
-            print("SUPPORT: If you believe this is an error, contact support")
-            print("         with your HWID for manual review.")
-            print()
-            print("NOTE: Hardware bans are permanent and cannot")
-            print("      be bypassed by reinstalling the game.")
-        else:
-            print()
-            print("[OK] HARDWARE VERIFICATION PASSED")
-            print("-" * 30)
-            print("STATUS: CLEAN")
-            print(f"HWID: {hwid_hash[:12]}...{hwid_hash[-12:]}")
-            print("SCAN TYPE: Fresh hardware fingerprint")
-            print("BAN WAVE: No matches found in database")
-            print("ACTION: Access granted")
-            print("-" * 30)
-            print()
-            print("SUCCESS: Welcome! Your system passed all anti-cheat checks.")
-            print("VERIFIED: Hardware fingerprint verified as clean.")
-            print("READY: You're ready to play!")
-        
-        print("\n" + "="*50)
+        template = ANTICHEAT_BANNED_TEMPLATE if is_banned else ANTICHEAT_CLEAN_TEMPLATE
+        write_console(template.format(head=hwid_hash[:12], tail=hwid_hash[-12:]))
         return True
     else:
         print(f"\n[ERROR] ANTI-CHEAT ERROR")
@@ -1797,42 +2443,52 @@ def threaded_anticheat_test(worker):
 
 def show_ban_management_menu(ban_manager, worker):
     """Display and handle ban management menu"""
+    ban_lines = None  # Formatted ban list, rebuilt only after the bans change
+    
     while True:
         clear_screen()
-        print("=" * 60)
-        print("        ANTI-CHEAT SIMULATOR")
-        print("=" * 60)
-        print()
-        
-        banned_hwids = ban_manager.get_banned_hwids()
-        print(f"Currently banned HWIDs: {len(banned_hwids)}")
-        
-        if banned_hwids:
-            print("\nBanned HWIDs:")
-            for i, hwid in enumerate(banned_hwids, 1):
-                print(f"  {i}. {hwid[:8]}...{hwid[-8:]}")
+        if ban_lines is None:
+            banned_hwids = ban_manager.get_banned_hwids()
+            ban_lines = [f"  {i}. {hwid[:8]}...{hwid[-8:]}" for i, hwid in enumerate(banned_hwids, 1)]
+        
+        buf = [
+            BAR60,
+            "        ANTI-CHEAT SIMULATOR",
+            BAR60,
+            "",
+            f"Currently banned HWIDs: {len(banned_hwids)}",
+        ]
         
-        print()
-        print("1. Run Anti-Cheat Test")
-        print("2. Ban Current HWID")
-        print("3. Ban HWID by Hash")
-        print("4. Unban HWID")
-        print("5. Clear All Bans")
-        print("6. Back to Main Menu")
-        print()
-        print("=" * 60)
+        if ban_lines:
+            buf.append("\nBanned HWIDs:")
+            buf.extend(ban_lines)
+        
+        buf.extend([
+            "",
+            "1. Run Anti-Cheat Test",
+            "2. Ban Current HWID",
+            "3. Ban HWID by Hash",
+            "4. Unban HWID",
+            "5. Clear All Bans",
+            "6. Back to Main Menu",
+            "",
+            BAR60,
+        ])
+        render(buf)
         
         choice = input("Select option (1-6): ").strip()
+        if choice in ('2', '3', '4', '5'):
+            ban_lines = None
         
         if choice == '1':
             # Run anti-cheat test (threaded)
             threaded_anticheat_test(worker)
-            input("\nPress Enter to continue...")
+            poll_input("\nPress Enter to continue...", worker)
         
         elif choice == '2':
             # Ban current HWID (threaded)
             threaded_ban_current_hwid(worker)
-            input("Press Enter to continue...")
+            poll_input("Press Enter to continue...", worker)
         
         elif choice == '3':
             # Ban HWID by hash
@@ -1842,13 +2498,13 @@ def show_ban_management_menu(ban_manager, worker):
                 print(f"\n{message}")
             else:
                 print("\nNo HWID hash provided")
-            input("Press Enter to continue...")
+            poll_input("Press Enter to continue...", worker)
         
         elif choice == '4':
             # Unban HWID
             if not banned_hwids:
                 print("\nNo HWIDs are currently banned")
-                input("Press Enter to continue...")
+                poll_input("Press Enter to continue...", worker)
                 continue
             
             print("\nSelect HWID to unban:")
@@ -1865,52 +2521,65 @@ def show_ban_management_menu(ban_manager, worker):
                     print("\nInvalid selection")
             except ValueError:
                 print("\nPlease enter a valid number")
-            input("Press Enter to continue...")
+            poll_input("Press Enter to continue...", worker)
         
         elif choice == '5':
             # Clear all bans
             if banned_hwids:
-                confirm = input(f"Are you sure you want to clear all {len(banned_hwids)} bans? (y/N): ").strip().lower()
-                if confirm == 'y':
+                if getch_yn(f"Are you sure you want to clear all {len(banned_hwids)} bans? (y/N): "):
                     success, message = ban_manager.clear_all_bans()
                     print(f"\n{message}")
                 else:
                     print("\nOperation cancelled")
             else:
                 print("\nNo HWIDs are currently banned")
-            input("Press Enter to continue...")
+            poll_input("Press Enter to continue...", worker)
         
         elif choice == '6':
             break
 
-def view_logs():
+def read_last_lines(path, count, block_size=8192):
+    """Read the last count lines of a file, reading backwards from the end in blocks"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        
+        # One more newline than lines wanted, the file usually ends with one
+        while position > 0 and data.count(b'\n') <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    
+    lines = data.splitlines()
+    return [line.decode('utf-8', errors='replace') for line in lines[-count:]]
+
+def view_logs(worker=None):
     """Display recent log entries"""
     clear_screen()
-    print("=" * 60)
+    print(BAR60)
     print("           RECENT LOGS")
-    print("=" * 60)
+    print(BAR60)
     print()
     
-    log_file = Path("data/evaders_hwid.log")
+    log_file = DATA_DIR / "evaders_hwid.log"
     
     try:
         if log_file.exists():
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                # Show last 20 lines
-                for line in lines[-20:]:
-                    print(line.strip())
+            # Show last 20 lines
+            for line in read_last_lines(log_file, 20):
+                print(line.strip())
         else:
             print("No log file found")
     except Exception as e:
         print(f"Error reading log file: {e}")
     
     print()
-    input("Press Enter to continue...")
+    poll_input("Press Enter to continue...", worker)
 
 def collect_hwid_data():
     """Collect comprehensive HWID data"""
-    logger = logging.getLogger(__name__)
     logger.info("Starting HWID data collection")
     
     print("Collecting hardware information...")
@@ -1920,18 +2589,27 @@ def collect_hwid_data():
     hardware_data = {}
     
     try:
-        hardware_data['core_hwid'] = get_core_hwid_info()
-        hardware_data['system'] = get_system_info()
-        hardware_data['cpu'] = get_cpu_info()
-        hardware_data['memory'] = get_memory_info()
-        hardware_data['storage'] = get_storage_info()
-        hardware_data['network'] = get_network_info()
-        hardware_data['motherboard_bios'] = get_motherboard_bios_info()
-        hardware_data['gpu'] = get_gpu_info()
-        hardware_data['usb_devices'] = get_usb_devices()
-        hardware_data['audio_devices'] = get_audio_devices()
-        hardware_data['system_slots'] = get_system_slots()
-        hardware_data['tpm'] = get_tpm_info()
+        # Run every WMI query up front in a single PowerShell process
+        print("Querying WMI...")
+        wmi_results = run_wmi_batch(WMI_QUERIES, {'mac_addresses': MAC_ADDRESS_COMMAND})
+        
+        # Run the probes one at a time so their progress lines stay in order
+        probes = {
+            'core_hwid': get_core_hwid_info,
+            'system': get_system_info,
+            'cpu': get_cpu_info,
+            'memory': get_memory_info,
+            'storage': get_storage_info,
+            'network': get_network_info,
+            'motherboard_bios': get_motherboard_bios_info,
+            'gpu': get_gpu_info,
+            'usb_devices': get_usb_devices,
+            'audio_devices': get_audio_devices,
+            'system_slots': get_system_slots,
+            'tpm': get_tpm_info,
+        }
+        for key, probe in probes.items():
+            hardware_data[key] = probe(wmi_results)
         
         logger.info("HWID data collection completed successfully")
         return hardware_data
@@ -1968,28 +2646,31 @@ def main():
     logger.info("Evaders HWID initialized with background worker and monitoring")
     
     # Check if running on Windows
-    if platform.system() != 'Windows':
+    if not IS_WINDOWS:
         print("Warning: This script is optimized for Windows.")
         print("Some features may not work on other platforms.")
-        input("Press Enter to continue...")
+        poll_input("Press Enter to continue...", worker)
     
     # Compare on startup if enabled
     if settings_manager.get('compare_on_startup'):
         print("Performing startup HWID comparison...")
         hwid_data = collect_hwid_data()
         if hwid_data:
-            match, message = report_manager.compare_hwid(hwid_data)
+            worker.seed_initial_snapshot(hwid_data)
+            match, message, _ = report_manager.compare_hwid(hwid_data)
             if match is False:
                 print(f"WARNING: {message}")
-                input("Press Enter to continue...")
+                poll_input("Press Enter to continue...", worker)
     
     # Main menu loop
     while True:
-        # Get current stats summary for display
-        stats_summary = {
-            'total_checks': stats_manager.stats.get('total_checks', 0),
-            'total_changes': stats_manager.stats.get('total_changes', 0)
-        }
+        # The stats summary is only shown while monitoring is active
+        stats_summary = None
+        if worker.monitoring:
+            stats_summary = {
+                'total_checks': stats_manager.total_checks,
+                'total_changes': stats_manager.total_changes
+            }
         
         show_main_menu(monitoring_active=worker.monitoring, stats_summary=stats_summary)
         choice = input("Select option (1-8): ").strip()
@@ -2009,13 +2690,13 @@ def main():
                         else:
                             print("Error: Report not found to save!")
             
-            input("\nPress Enter to continue...")
+            poll_input("\nPress Enter to continue...", worker)
         
         elif choice == '2':
             # Compare current HWID (threaded)
             logger.info("User requested HWID comparison")
             threaded_compare_hwid(worker)
-            input("\nPress Enter to continue...")
+            poll_input("\nPress Enter to continue...", worker)
         
         elif choice == '3':
             # View current HWID report
@@ -2028,14 +2709,17 @@ def main():
                     display_core_hwid(current_report['core_hwid'])
                 
                 if 'metadata' in current_report:
-                    print(f"\nReport generated: {current_report['metadata'].get('generated_date', 'Unknown')}")
-                    print(f"HWID Hash: {current_report['metadata'].get('hwid_hash', 'Unknown')}")
+                    metadata = current_report['metadata']
+                    render([
+                        f"\nReport generated: {metadata.get('generated_date', 'Unknown')}",
+                        f"HWID Hash: {metadata.get('hwid_hash', 'Unknown')}",
+                    ])
                 
-                input("\nPress Enter to continue...")
+                poll_input("\nPress Enter to continue...", worker)
             else:
                 print("No current HWID report found!")
                 print("Generate a new report first.")
-                input("Press Enter to continue...")
+                poll_input("Press Enter to continue...", worker)
         
         elif choice == '4':
             # Anti-Cheat Simulator
@@ -2058,7 +2742,7 @@ def main():
                 print(f"\nBackground Monitoring: INACTIVE")
                 print("Enable in Settings > Background Monitoring")
             
-            input("\nPress Enter to continue...")
+            poll_input("\nPress Enter to continue...", worker)
         
         elif choice == '6':
             # Settings
@@ -2068,7 +2752,7 @@ def main():
         elif choice == '7':
             # View logs
             logger.info("User requested to view logs")
-            view_logs()
+            view_logs(worker)
         
         elif choice == '8':
             # Exit
@@ -2080,7 +2764,16 @@ def main():
         
         else:
             print("Invalid choice. Please try again.")
-            input("Press Enter to continue...")
+            poll_input("Press Enter to continue...", worker)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaders HWID")
+    parser.add_argument('--install-deps', action='store_true',
+                        help="install missing dependencies with pip before starting")
+    args = parser.parse_args()
+    
+    print("Initializing Evaders HWID...")
+    if args.install_deps:
+        install_dependencies()
+    
     main()
\ No newline at end of file